@@ -85,9 +85,11 @@ def get_db(ctx: click.Context) -> GVSA_Database:
               help='Number of parallel workers (default: 5)')
 @click.option('--delay', default=1.0, type=float,
               help='Delay between requests in seconds (default: 1.0)')
+@click.option('--compress-cache', is_flag=True,
+              help='Store fetched HTML gzip-compressed (.html.gz)')
 @click.pass_context
 def scrape(ctx: click.Context, force_refresh: bool, no_cache: bool, 
-          workers: int, delay: float) -> None:
+          workers: int, delay: float, compress_cache: bool) -> None:
     """
     Scrape data from gvsoccer.org and cache locally.
     
@@ -101,6 +103,8 @@ def scrape(ctx: click.Context, force_refresh: bool, no_cache: bool,
         gvsa scrape --force-refresh --workers 10
     
         gvsa scrape --no-cache
+    
+        gvsa scrape --compress-cache
     """
     verbose = ctx.obj['verbose']
     
@@ -112,7 +116,8 @@ def scrape(ctx: click.Context, force_refresh: bool, no_cache: bool,
     scraper = GVSAScraper(
         delay=delay,
         use_cache=not no_cache,
-        max_workers=workers
+        max_workers=workers,
+        compress_cache=compress_cache
     )
     
     # Fetch HTML and CSV files
@@ -364,12 +369,12 @@ def csv_links(ctx: click.Context, division_name: Optional[str], year: Optional[i
             html_path = scraper.CACHE_DIR / cache_dir_name / f"{sanitized_name}.html"
             
             csv_link: Optional[str] = None
-            if html_path.exists():
-                try:
-                    html_content = html_path.read_text(encoding='utf-8')
+            try:
+                html_content = scraper.read_html_cache_file(html_path)
+                if html_content is not None:
                     csv_link = parse_csv_link(html_content)
-                except Exception:
-                    pass
+            except Exception:
+                pass
             
             result.append({
                 'division_name': division.division_name,
@@ -611,7 +616,7 @@ def db_import(ctx: click.Context, workers: int, cache_dir: str,
         gvsa db import --skip-csv    # Only import HTML
         gvsa db import --skip-html   # Only import CSV
     """
-    from .import_csv import import_csv_matches, find_csv_files
+    from .import_csv import import_csv_files, find_csv_files
     
     db_path = ctx.obj['db_path']
     verbose = ctx.obj['verbose']
@@ -675,11 +680,9 @@ def db_import(ctx: click.Context, workers: int, cache_dir: str,
             }
             
             try:
-                for i, csv_file in enumerate(csv_files, 1):
+                for i, csv_file, stats in import_csv_files(csv_files, db_instance, verbose=verbose):
                     if verbose:
-                        click.echo(f"[{i}/{len(csv_files)}] Processing {csv_file.relative_to(cache_path)}...")
-                    
-                    stats = import_csv_matches(csv_file, db_instance, verbose=verbose)
+                        click.echo(f"[{i}/{len(csv_files)}] Processed {csv_file.relative_to(cache_path)}")
                     
                     csv_stats['matches_found'] += stats['matches_found']
                     csv_stats['matches_imported'] += stats['matches_imported']
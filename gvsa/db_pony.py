@@ -6,13 +6,23 @@ This module provides functionality to manage the database using PonyORM,
 including team name matching, club detection, and data persistence.
 """
 from typing import List, Dict, Any, Optional, Tuple
-from pony.orm import db_session, select, commit
+from functools import lru_cache
+from pony.orm import db_session, select, flush
 import re
 from thefuzz import fuzz, process
 from .models import db, Season, Division, Club, Team, TeamSeason, Match, SeasonType
 from .team_name_parser import parse_team_name, normalize_team_identifier, extract_base_identifier
 
 
+class InvalidStandingsError(ValueError):
+    """
+    Standings data rejected by save_standings() before anything was written.
+    
+    Raised for input that cannot be saved at all (no year, no division_id),
+    so a batch can skip the division without rolling back the others.
+    """
+
+
 class TeamMatcher:
     """
     Matches team names across seasons using fuzzy string matching.
@@ -68,12 +78,14 @@ class TeamMatcher:
         return name.strip()
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def normalize_name(name: str) -> str:
         """
         Normalize team name for matching.
         
         Uses clean_club_name to clean the name first, then normalizes
-        for case-insensitive matching.
+        for case-insensitive matching. Results are memoized: the same team
+        and club names are normalized over and over during imports and review.
         
         Parameters
         ----------
@@ -252,6 +264,26 @@ class TeamMatcher:
             # If not in db_session, return None
             return None
         
+        return TeamMatcher.pick_team_by_designation(candidates, designation)
+    
+    @staticmethod
+    def pick_team_by_designation(candidates: List[Team],
+                                 designation: Optional[str] = None) -> Optional[Team]:
+        """
+        Pick the team matching a designation from same birth year/gender/club teams.
+        
+        Parameters
+        ----------
+        candidates : List[Team]
+            Teams sharing birth year, gender, and base club name
+        designation : Optional[str]
+            Color/descriptor designation (optional)
+            
+        Returns
+        -------
+        Optional[Team]
+            Matching team or None if there are no candidates
+        """
         if not candidates:
             return None
         
@@ -264,14 +296,10 @@ class TeamMatcher:
             # If no exact match, return first candidate (designation may have been added)
             # This implements the rule: if team without designation existed before,
             # later team with designation is the same team
-            if candidates:
-                return candidates[0]
-        else:
-            # No designation specified - return first match (any designation is fine)
-            if candidates:
-                return candidates[0]
+            return candidates[0]
         
-        return None
+        # No designation specified - return first match (any designation is fine)
+        return candidates[0]
 
 
 class GVSA_Database:
@@ -310,6 +338,7 @@ class GVSA_Database:
         Get or create a season.
         
         Handles race conditions by catching IntegrityError and retrying.
+        Changes are flushed, not committed, so a caller's transaction stays whole.
         
         Parameters
         ----------
@@ -340,7 +369,7 @@ class GVSA_Database:
             # Update season_name if it's different (shouldn't happen, but handle it)
             if season.season_name != season_name:
                 season.season_name = season_name
-                commit()
+                flush()
         else:
             # Create new season - handle race condition
             try:
@@ -349,7 +378,7 @@ class GVSA_Database:
                     season_type=season_type_str,
                     season_name=season_name
                 )
-                commit()
+                flush()
             except Exception as e:
                 # If IntegrityError (race condition), try to get the season again
                 if 'UNIQUE constraint' in str(e) or 'IntegrityError' in str(type(e).__name__):
@@ -360,7 +389,7 @@ class GVSA_Database:
                     # Update season_name if needed
                     if season.season_name != season_name:
                         season.season_name = season_name
-                        commit()
+                        flush()
                 else:
                     raise
         
@@ -432,7 +461,7 @@ class GVSA_Database:
                 division_name=division_name,
                 season=season
             )
-            commit()
+            flush()
         
         return division
     
@@ -460,12 +489,12 @@ class GVSA_Database:
         
         if not club:
             club = Club(name=cleaned_name, canonical_name=normalized)
-            commit()
+            flush()
         else:
             # Update the name if it's different (to use cleaned version)
             if club.name != cleaned_name:
                 club.name = cleaned_name
-                commit()
+                flush()
         
         return club
     
@@ -540,9 +569,52 @@ class GVSA_Database:
             club = self.get_or_create_club(club_name)
             team.club = club
         
-        commit()
+        flush()
         return team, True
     
+    def save_standings_batch(self, standings_list: List[Dict[str, Any]]) -> List[Tuple[Dict[str, Any], Exception]]:
+        """
+        Save several divisions' standings in a single transaction.
+        
+        Nested save_standings() calls join this db_session, so the whole
+        batch is committed once instead of once per division. Divisions
+        rejected up front with InvalidStandingsError are skipped; if anything
+        else goes wrong the batch is rolled back and retried one division per
+        transaction, so a failed division is never left half-written and
+        cannot discard the rest.
+        
+        Parameters
+        ----------
+        standings_list : List[Dict[str, Any]]
+            Standings data dictionaries, as passed to save_standings()
+            
+        Returns
+        -------
+        List[Tuple[Dict[str, Any], Exception]]
+            Standings data and error for each division that was not saved
+        """
+        try:
+            with db_session:
+                failed: List[Tuple[Dict[str, Any], Exception]] = []
+                for standings_data in standings_list:
+                    try:
+                        self.save_standings(standings_data)
+                    except InvalidStandingsError as e:
+                        # Raised before any writes, so the rest of the batch is unaffected
+                        failed.append((standings_data, e))
+            return failed
+        except Exception:
+            pass
+        
+        # Retry one division at a time so only the failing ones are lost
+        failed = []
+        for standings_data in standings_list:
+            try:
+                self.save_standings(standings_data)
+            except Exception as e:
+                failed.append((standings_data, e))
+        return failed
+    
     @db_session
     def save_standings(self, standings_data: Dict[str, Any]) -> None:
         """
@@ -578,7 +650,13 @@ class GVSA_Database:
                     pass
         
         if year is None:
-            raise ValueError(f"Could not extract year from division info: {division_info}")
+            raise InvalidStandingsError(f"Could not extract year from division info: {division_info}")
+        
+        # Validate division_id is present and not empty (Required field).
+        # Checked before any writes so batch saves can skip the division cleanly.
+        division_id = division_info.get('division_id', '').strip()
+        if not division_id:
+            raise InvalidStandingsError(f"division_id is required but missing for division: {division_info.get('division_name', 'unknown')}")
         
         # Get normalized season_type
         season_type_str = division_info.get('season_type', 'Fall')
@@ -600,11 +678,6 @@ class GVSA_Database:
             season_type_str
         )
         
-        # Validate division_id is present and not empty (Required field)
-        division_id = division_info.get('division_id', '').strip()
-        if not division_id:
-            raise ValueError(f"division_id is required but missing for division: {division_info.get('division_name', 'unknown')}")
-        
         # Get or create division
         division = self.get_or_create_division(
             division_id,
@@ -654,7 +727,7 @@ class GVSA_Database:
             
             team_seasons[team_name] = team_season
         
-        commit()
+        flush()
         
         # Process matches
         matches_data = standings_data.get('matches', [])
@@ -710,6 +783,6 @@ class GVSA_Database:
                 status=match_data.get('status', 'scheduled')
             )
         
-        commit()
+        flush()
         print(f"  - Saved to database (division_id: {division.id})")
 
@@ -5,14 +5,17 @@ Import match data from CSV files into the database.
 This script scans CSV files in html_cache directories and imports matches
 directly into the database with 1:1 team name matching (exact names from CSV).
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator, Tuple
 from pathlib import Path
 import re
 import sys
 from .parse_csv import parse_csv_standings
 from .db_pony import GVSA_Database
 from .models import db, Season, Division, TeamSeason, Match
-from pony.orm import db_session, select, commit
+from pony.orm import db_session, select, flush
+
+# CSV files imported per database transaction by import_csv_files()
+CSV_IMPORT_BATCH_SIZE = 50
 
 
 def extract_season_info_from_path(csv_path: Path) -> Optional[Dict[str, Any]]:
@@ -123,7 +126,7 @@ def import_csv_matches(csv_path: Path, db_instance: GVSA_Database, verbose: bool
     
     if not matches_data:
         if verbose:
-            print(f"  No matches found in {csv_path.name}")
+            print(_import_progress_line(csv_path, stats))
         return stats
     
     # Import matches - use team names 1:1 as they appear in CSV
@@ -204,15 +207,93 @@ def import_csv_matches(csv_path: Path, db_instance: GVSA_Database, verbose: bool
         except Exception as e:
             stats['errors'].append(f"Error creating match {home_team_name} vs {away_team_name}: {e}")
     
-    commit()
+    # Committed when the outermost db_session exits (per file, or per batch in import_csv_files)
+    flush()
     
     if verbose:
-        print(f"  {csv_path.name}: {stats['matches_imported']}/{stats['matches_found']} matches imported, "
-              f"{stats['teams_created']} teams created")
+        print(_import_progress_line(csv_path, stats))
     
     return stats
 
 
+def _import_progress_line(csv_path: Path, stats: Dict[str, Any]) -> Optional[str]:
+    """
+    Format the verbose progress line for one imported CSV file.
+    
+    Parameters
+    ----------
+    csv_path : Path
+        Path to CSV file
+    stats : Dict[str, Any]
+        Statistics returned by import_csv_matches()
+        
+    Returns
+    -------
+    Optional[str]
+        Progress line, or None if the file could not be read or parsed
+        (its errors are reported instead)
+    """
+    if stats['matches_found'] == 0:
+        return None if stats['errors'] else f"  No matches found in {csv_path.name}"
+    return (f"  {csv_path.name}: {stats['matches_imported']}/{stats['matches_found']} matches imported, "
+            f"{stats['teams_created']} teams created")
+
+
+def import_csv_files(csv_files: List[Path], db_instance: GVSA_Database, verbose: bool = True,
+                     batch_size: int = CSV_IMPORT_BATCH_SIZE) -> Iterator[Tuple[int, Path, Dict[str, Any]]]:
+    """
+    Import several CSV files, committing once per batch instead of once per file.
+    
+    Statistics are only yielded once their batch has committed. If a batch
+    fails it is rolled back and its files are imported again one per
+    transaction, so only the files that fail on their own are lost; those
+    are yielded with nothing imported and the error recorded.
+    
+    Parameters
+    ----------
+    csv_files : List[Path]
+        CSV files to import
+    db_instance : GVSA_Database
+        Database instance
+    verbose : bool
+        Print progress messages
+    batch_size : int
+        Files imported per transaction (default: CSV_IMPORT_BATCH_SIZE)
+        
+    Yields
+    ------
+    Tuple[int, Path, Dict[str, Any]]
+        1-based file index, CSV path and the import_csv_matches() statistics
+    """
+    for start in range(0, len(csv_files), batch_size):
+        batch = list(enumerate(csv_files[start:start + batch_size], start + 1))
+        try:
+            with db_session:
+                results = [(i, csv_file, import_csv_matches(csv_file, db_instance, verbose=False))
+                           for i, csv_file in batch]
+        except Exception:
+            # Retry the files one per transaction so a bad file only loses itself
+            results = []
+            for i, csv_file in batch:
+                try:
+                    stats = import_csv_matches(csv_file, db_instance, verbose=False)
+                except Exception as e:
+                    stats = {
+                        'matches_found': 0,
+                        'matches_imported': 0,
+                        'teams_created': 0,
+                        'errors': [f"Error importing {csv_file}: {e}"]
+                    }
+                results.append((i, csv_file, stats))
+        
+        for i, csv_file, stats in results:
+            # Printed here rather than by import_csv_matches(), so only committed files are reported
+            progress_line = _import_progress_line(csv_file, stats) if verbose else None
+            if progress_line is not None:
+                print(progress_line)
+            yield i, csv_file, stats
+
+
 def find_csv_files(cache_dir: Path = Path("html_cache")) -> List[Path]:
     """
     Find all CSV files in the cache directory.
@@ -263,10 +344,8 @@ def main() -> None:
     }
     
     try:
-        for i, csv_file in enumerate(csv_files, 1):
-            print(f"[{i}/{len(csv_files)}] Processing {csv_file.relative_to(cache_dir)}...")
-            
-            stats = import_csv_matches(csv_file, db_instance, verbose=False)
+        for i, csv_file, stats in import_csv_files(csv_files, db_instance, verbose=False):
+            print(f"[{i}/{len(csv_files)}] Processed {csv_file.relative_to(cache_dir)}")
             
             total_stats['matches_found'] += stats['matches_found']
             total_stats['matches_imported'] += stats['matches_imported']
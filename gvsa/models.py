@@ -14,6 +14,30 @@ from enum import Enum
 db = Database()
 
 
+@db.on_connect(provider='sqlite')
+def _configure_sqlite(database: Database, connection) -> None:
+    """
+    Tune each new SQLite connection for the write-heavy import pipeline.
+    
+    WAL lets readers run alongside the writer and, with synchronous=NORMAL,
+    commits no longer fsync the main database file (WAL mode is persistent;
+    the other settings are per connection).
+    
+    Parameters
+    ----------
+    database : Database
+        The Pony database being connected
+    connection : sqlite3.Connection
+        The new DB-API connection
+    """
+    cursor = connection.cursor()
+    cursor.execute('PRAGMA journal_mode = WAL')
+    cursor.execute('PRAGMA synchronous = NORMAL')
+    cursor.execute('PRAGMA cache_size = -65536')  # 64 MiB page cache
+    cursor.execute('PRAGMA temp_store = MEMORY')
+    cursor.execute('PRAGMA mmap_size = 268435456')  # 256 MiB
+
+
 class SeasonType(Enum):
     """Season type enumeration."""
     Fall = "Fall"
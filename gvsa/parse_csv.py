@@ -5,20 +5,156 @@ Parse CSV data from GVSA standings export.
 This module parses CSV data exported from standings.jsp to extract
 teams and match results more reliably than HTML parsing.
 """
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional, Tuple, NamedTuple
 import csv
 import io
 import re
 
 
-def parse_csv_standings(csv_content: str) -> Dict[str, Any]:
+# Bytes read from a CSV download before deciding whether it is CSV at all
+_SNIFF_SIZE = 4096
+
+# Sentinel codes returned by _parse_score for forfeit cells
+_SCORE_WF = -2  # Win Forfeit
+_SCORE_LF = -3  # Loss Forfeit
+_FORFEIT_CODES = frozenset((_SCORE_WF, _SCORE_LF))
+
+# Valid forfeit outcomes keyed by (home_code, away_code) -> (home_score, away_score)
+# Option B: winner=1, loser=NULL
+_FORFEIT_SCORES = {
+    (_SCORE_WF, _SCORE_LF): (1, None),  # Home team won by forfeit
+    (_SCORE_LF, _SCORE_WF): (None, 1),  # Away team won by forfeit
+}
+_FORFEIT_RESULTS = frozenset(_FORFEIT_SCORES.values())
+
+# Team stat keys (in TeamRow order) and the header names each may appear under
+_TEAM_STAT_COLUMNS = (
+    ('wins', ('Wins',)),
+    ('losses', ('Losses',)),
+    ('ties', ('Ties',)),
+    ('forfeits', ('Forfeits',)),
+    ('points', ('PTS', 'Points')),
+    ('goals_for', ('GF', 'Goals For')),
+    ('goals_against', ('GA', 'Goals Against')),
+    ('goal_differential', ('GD', 'Goal Differential')),
+)
+
+
+class TeamRow(NamedTuple):
+    """One team standings row; fields match the team dictionaries."""
+    team_name: str
+    wins: int
+    losses: int
+    ties: int
+    forfeits: int
+    points: int
+    goals_for: int
+    goals_against: int
+    goal_differential: int
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the row as a team dictionary."""
+        return dict(zip(self._fields, self))
+
+
+class MatchRow(NamedTuple):
+    """One match row; fields match the match dictionaries."""
+    date: str
+    time: str
+    home_team: str
+    away_team: str
+    field: str
+    home_score: Optional[int]
+    away_score: Optional[int]
+    status: str
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the row as a match dictionary."""
+        return dict(zip(self._fields, self))
+
+
+def _parse_score(score_str: str) -> Optional[int]:
     """
-    Parse CSV content from standings.jsp export.
+    Classify a raw score cell in a single pass.
     
-    The CSV typically contains both team standings and match results.
-    CSV files use positional format (no headers):
-    - Matches: Game No, Day, Date, Time, Home Team, Home Score, Away Score, Away Team, Field
-    - Teams: Team, Wins, Losses, Ties, Forfeits, Points, GF, GA, GD (if headers present)
+    Parameters
+    ----------
+    score_str : str
+        Stripped score cell from the CSV (e.g., "3", "WF", "LF", "")
+        
+    Returns
+    -------
+    Optional[int]
+        The integer score, _SCORE_WF / _SCORE_LF for forfeits,
+        or None if the cell is empty or not a number
+    """
+    if score_str.isdecimal():
+        return int(score_str)
+    # Case-insensitive "WF"/"LF" check without allocating an upper() copy
+    if len(score_str) == 2 and score_str[1] in 'Ff':
+        if score_str[0] in 'Ww':
+            return _SCORE_WF
+        if score_str[0] in 'Ll':
+            return _SCORE_LF
+    return None
+
+
+def _parse_int(value: str) -> int:
+    """Parse integer, handling empty strings and non-numeric values."""
+    value = value.strip()
+    if value.isdecimal():
+        return int(value)
+    if not value:
+        return 0
+    try:
+        return int(value)
+    except ValueError:
+        return 0
+
+
+def _first_column(fieldnames: List[str], names: Tuple[str, ...]) -> Optional[str]:
+    """Return the first of names present in fieldnames, or None."""
+    for name in names:
+        if name in fieldnames:
+            return name
+    return None
+
+
+def _rows_as_dicts(fieldnames: List[str], rows: List[List[str]]) -> List[Dict[str, str]]:
+    """
+    Map positional rows onto header names.
+    
+    Equivalent to csv.DictReader but works on rows that are already
+    tokenized, so the CSV text is only read once. Blank rows are skipped
+    and missing trailing cells map to an empty string.
+    
+    Parameters
+    ----------
+    fieldnames : List[str]
+        Header row
+    rows : List[List[str]]
+        Data rows (without the header)
+        
+    Returns
+    -------
+    List[Dict[str, str]]
+        One dictionary per non-blank row
+    """
+    width = len(fieldnames)
+    return [
+        dict(zip(fieldnames, row + [''] * (width - len(row))))
+        for row in rows
+        if row
+    ]
+
+
+def _tokenize(csv_content: str) -> List[List[str]]:
+    """
+    Split CSV content into rows of cells.
+    
+    GVSA exports are normally unquoted, in which case a plain str.split
+    yields the same rows as csv.reader without its per-cell overhead.
+    Content with quotes or stray carriage returns goes through csv.reader.
     
     Parameters
     ----------
@@ -27,20 +163,47 @@ def parse_csv_standings(csv_content: str) -> Dict[str, Any]:
         
     Returns
     -------
-    Dict[str, Any]
-        Dictionary containing:
-        - teams: List[Dict[str, Any]]
-        - matches: List[Dict[str, Any]]
+    List[List[str]]
+        Rows of cells; blank lines become empty rows, as with csv.reader
+    """
+    if '"' not in csv_content:
+        text = csv_content.replace('\r\n', '\n')
+        if '\r' not in text:
+            lines = text.split('\n')
+            if not lines[-1]:
+                # Trailing newline (or empty content) does not start a row
+                lines.pop()
+            return [line.split(',') if line else [] for line in lines]
+    return list(csv.reader(io.StringIO(csv_content)))
+
+
+def parse_csv_records(csv_content: str) -> Tuple[List[TeamRow], List[MatchRow]]:
+    """
+    Parse CSV content from standings.jsp export into compact row records.
+    
+    This is the parser behind parse_csv_standings(). Use it directly when a
+    large number of rows is being held in memory; call as_dict() on a row
+    where a mapping is needed.
+    
+    Parameters
+    ----------
+    csv_content : str
+        CSV content as string
+        
+    Returns
+    -------
+    Tuple[List[TeamRow], List[MatchRow]]
+        (team rows, match rows)
     """
-    teams: List[Dict[str, Any]] = []
-    matches: List[Dict[str, Any]] = []
+    teams: List[TeamRow] = []
+    matches: List[MatchRow] = []
     
-    # Parse CSV - try both DictReader (with headers) and reader (positional)
-    csv_reader = csv.reader(io.StringIO(csv_content))
-    first_row = next(csv_reader, None)
+    # Tokenize once - header detection and row parsing share the same rows
+    rows = _tokenize(csv_content)
     
-    if first_row is None:
-        return {'teams': teams, 'matches': matches}
+    if not rows:
+        return teams, matches
+    first_row = rows[0]
     
     # Determine if this is teams or matches CSV by examining first row
     # Matches CSV typically starts with game number (e.g., "1461-3", "1473-2")
@@ -53,10 +216,9 @@ def parse_csv_standings(csv_content: str) -> Dict[str, Any]:
     if len(first_row) > 0:
         first_col_lower = first_row[0].strip().lower() if first_row[0] else ''
         if first_col_lower in ['team', 'game no', 'game']:
-            # Has headers, reset and use DictReader
+            # Has headers - map the remaining rows by column name
             has_headers = True
-            csv_reader_dict = csv.DictReader(io.StringIO(csv_content))
-            fieldnames = csv_reader_dict.fieldnames
+            fieldnames = first_row
             if fieldnames:
                 is_teams = any(col.lower() in ['team', 'wins', 'losses', 'points'] for col in fieldnames)
                 is_matches = any(col.lower() in ['game no', 'game', 'date', 'home team', 'away team'] for col in fieldnames)
@@ -70,48 +232,33 @@ def parse_csv_standings(csv_content: str) -> Dict[str, Any]:
                     is_matches = True
                     has_headers = False
     
-    # Set up the appropriate reader based on what we detected
+    # Pick the rows to iterate based on what we detected
     if has_headers and (is_teams or is_matches):
-        csv_reader = csv.DictReader(io.StringIO(csv_content))
-    elif is_matches:
-        # Positional format for matches
-        csv_reader = csv.reader(io.StringIO(csv_content))
+        csv_rows = _rows_as_dicts(first_row, rows[1:])
     else:
-        # Unknown format, try positional
-        csv_reader = csv.reader(io.StringIO(csv_content))
+        # Positional format for matches (or unknown format, try positional)
+        csv_rows = rows
     
     if is_teams:
-        # Teams CSV with headers
-        for row in csv_reader:
+        # Teams CSV with headers - resolve each stat's column name once
+        stat_columns = [_first_column(fieldnames, names) for _, names in _TEAM_STAT_COLUMNS]
+        for row in csv_rows:
             team_name = row.get('Team', '').strip()
             if not team_name:
                 continue
             
-            def parse_int(value: str) -> int:
-                """Parse integer, handling empty strings."""
-                value = str(value).strip()
-                if not value:
-                    return 0
-                try:
-                    return int(value)
-                except ValueError:
-                    return 0
-            
-            teams.append({
-                'team_name': team_name,
-                'wins': parse_int(row.get('Wins', '0')),
-                'losses': parse_int(row.get('Losses', '0')),
-                'ties': parse_int(row.get('Ties', '0')),
-                'forfeits': parse_int(row.get('Forfeits', '0')),
-                'points': parse_int(row.get('PTS', row.get('Points', '0'))),
-                'goals_for': parse_int(row.get('GF', row.get('Goals For', '0'))),
-                'goals_against': parse_int(row.get('GA', row.get('Goals Against', '0'))),
-                'goal_differential': parse_int(row.get('GD', row.get('Goal Differential', '0')))
-            })
+            teams.append(TeamRow(team_name, *(
+                _parse_int(row[column]) if column else 0
+                for column in stat_columns
+            )))
     
     if is_matches:
+        # Team names, dates, times and fields repeat across many matches;
+        # share one string object per distinct value
+        share = {}.setdefault
+        
         # Matches CSV - handle both DictReader (headers) and positional
-        for row in csv_reader:
+        for row in csv_rows:
             if isinstance(row, dict):
                 # Has headers
                 home_team = row.get('Home Team', '').strip()
@@ -126,76 +273,127 @@ def parse_csv_standings(csv_content: str) -> Dict[str, Any]:
                 # Positional format: Game No, Day, Date, Time, Home Team, Home Score, Away Score, Away Team, Field
                 if len(row) < 8:
                     continue
-                home_team = row[4].strip() if len(row) > 4 else ''
-                away_team = row[7].strip() if len(row) > 7 else ''
-                date = row[2].strip() if len(row) > 2 else ''
-                time = row[3].strip() if len(row) > 3 else ''
-                field = row[8].strip() if len(row) > 8 else ''
-                home_score_str = row[5].strip() if len(row) > 5 else ''
-                away_score_str = row[6].strip() if len(row) > 6 else ''
-                day = row[1].strip() if len(row) > 1 else ''
+                # Strip each used cell once (Game No is not needed)
+                cells = [cell.strip() for cell in row[1:9]]
+                day, date, time, home_team, home_score_str, away_score_str, away_team = cells[:7]
+                field = cells[7] if len(cells) > 7 else ''
             
             if not home_team or not away_team:
                 continue
             
-            # Parse scores with forfeit handling (Option B: winner=1, loser=NULL)
-            home_score: Optional[int] = None
-            away_score: Optional[int] = None
+            # Parse scores with forfeit handling (WF = Win Forfeit, LF = Loss Forfeit)
+            home_code = _parse_score(home_score_str)
+            away_code = _parse_score(away_score_str)
             
-            # Check for forfeits (WF = Win Forfeit, LF = Loss Forfeit)
-            home_is_wf = home_score_str.upper() == 'WF'
-            home_is_lf = home_score_str.upper() == 'LF'
-            away_is_wf = away_score_str.upper() == 'WF'
-            away_is_lf = away_score_str.upper() == 'LF'
-            
-            if home_is_wf and away_is_lf:
-                # Home team won by forfeit
-                home_score = 1
-                away_score = None
-            elif home_is_lf and away_is_wf:
-                # Away team won by forfeit
-                home_score = None
-                away_score = 1
-            elif home_is_wf or home_is_lf or away_is_wf or away_is_lf:
+            forfeit_scores = _FORFEIT_SCORES.get((home_code, away_code))
+            if forfeit_scores is not None:
+                home_score, away_score = forfeit_scores
+                status = 'completed'
+            elif home_code in _FORFEIT_CODES or away_code in _FORFEIT_CODES:
                 # Invalid state - both should be WF/LF or neither
-                # Skip this row or handle as scheduled
                 continue
             else:
-                # Regular scores - parse as integers
-                if home_score_str and home_score_str.isdigit():
-                    home_score = int(home_score_str)
-                if away_score_str and away_score_str.isdigit():
-                    away_score = int(away_score_str)
-            
-            # Determine status
-            # Match is completed if both scores are set (including forfeits where winner=1)
-            # or if it's a forfeit (one score is 1, other is None)
-            is_forfeit = (home_score == 1 and away_score is None) or (away_score == 1 and home_score is None)
-            has_scores = home_score is not None and away_score is not None
-            status = 'completed' if (has_scores or is_forfeit) else 'scheduled'
+                # Regular scores - already parsed as integers (or None)
+                home_score, away_score = home_code, away_code
+                # Completed once both scores are set; a lone score of 1 is
+                # indistinguishable from a stored forfeit, so it counts too
+                if (home_score is not None and away_score is not None) or (home_score, away_score) in _FORFEIT_RESULTS:
+                    status = 'completed'
+                else:
+                    status = 'scheduled'
             
             # Combine day and date if available
             if day and date:
                 date = f"{day} {date}"
             
-            matches.append({
-                'date': date,
-                'time': time,
-                'home_team': home_team,
-                'away_team': away_team,
-                'field': field,
-                'home_score': home_score,
-                'away_score': away_score,
-                'status': status
-            })
+            matches.append(MatchRow(
+                share(date, date), share(time, time),
+                share(home_team, home_team), share(away_team, away_team),
+                share(field, field),
+                home_score, away_score, status
+            ))
+    
+    return teams, matches
+
+
+def parse_csv_standings(csv_content: str) -> Dict[str, Any]:
+    """
+    Parse CSV content from standings.jsp export.
+    
+    The CSV typically contains both team standings and match results.
+    CSV files use positional format (no headers):
+    - Matches: Game No, Day, Date, Time, Home Team, Home Score, Away Score, Away Team, Field
+    - Teams: Team, Wins, Losses, Ties, Forfeits, Points, GF, GA, GD (if headers present)
     
+    Parameters
+    ----------
+    csv_content : str
+        CSV content as string
+        
+    Returns
+    -------
+    Dict[str, Any]
+        Dictionary containing:
+        - teams: List[Dict[str, Any]]
+        - matches: List[Dict[str, Any]]
+    """
+    teams, matches = parse_csv_records(csv_content)
     return {
-        'teams': teams,
-        'matches': matches
+        'teams': [team.as_dict() for team in teams],
+        'matches': [match.as_dict() for match in matches]
     }
 
 
-def download_csv_standings(url: str, division_param: str, session) -> Optional[str]:
+def _fetch_csv(session, url: str, data: Dict[str, str], check_content_type: bool) -> Optional[str]:
+    """
+    POST a CSV request and return the body only if it looks like CSV.
+    
+    The response is streamed and the first chunk is sniffed before the
+    rest of the body is read, so HTML error pages are discarded without
+    decoding them in full.
+    
+    Parameters
+    ----------
+    session : requests.Session
+        Requests session object
+    url : str
+        URL to POST to
+    data : Dict[str, str]
+        Form data
+    check_content_type : bool
+        If True, accept only a text/csv Content-Type or a body starting with
+        "Game No"; otherwise accept any body with a comma near the start
+        
+    Returns
+    -------
+    Optional[str]
+        CSV content as string, or None if the request fails or the body
+        does not look like CSV
+    """
+    try:
+        with session.post(url, data=data, timeout=30, stream=True) as response:
+            response.raise_for_status()
+            if response.encoding is None:
+                response.encoding = 'utf-8'
+            
+            chunks = response.iter_content(_SNIFF_SIZE, decode_unicode=True)
+            head = next(chunks, '')
+            
+            if check_content_type:
+                looks_like_csv = ('text/csv' in response.headers.get('Content-Type', '')
+                                  or head.lstrip().startswith('Game No'))
+            else:
+                looks_like_csv = bool(head.strip()) and (',' in head[:100] or head.startswith('Game No'))
+            
+            if not looks_like_csv:
+                return None
+            return head + ''.join(chunks)
+    except Exception:
+        return None
+
+
+def download_csv_standings(url: str, division_param: str, session,
+                           wait_for_slot: Optional[Callable[[], None]] = None) -> Optional[str]:
     """
     Download CSV data from standings.jsp.
     
@@ -207,41 +405,30 @@ def download_csv_standings(url: str, division_param: str, session) -> Optional[s
         Division parameter string
     session : requests.Session
         Requests session object
+    wait_for_slot : Optional[Callable[[], None]]
+        Called before each request so the attempts share the caller's rate
+        limit (default: None, no waiting)
         
     Returns
     -------
     Optional[str]
         CSV content as string, or None if download fails
     """
-    # Try different methods to get CSV
-    
+    # Try different methods to get CSV, in order of preference:
     # Method 1: Add format=csv parameter
-    try:
-        response = session.post(url, data={'division': division_param, 'format': 'csv'}, timeout=30)
-        response.raise_for_status()
-        if 'text/csv' in response.headers.get('Content-Type', '') or response.text.strip().startswith('Game No'):
-            return response.text
-    except Exception:
-        pass
-    
     # Method 2: Use CSV endpoint
-    try:
-        csv_url = url.replace('.jsp', '.csv')
-        response = session.post(csv_url, data={'division': division_param}, timeout=30)
-        response.raise_for_status()
-        if response.text.strip() and (',' in response.text[:100] or response.text.startswith('Game No')):
-            return response.text
-    except Exception:
-        pass
-    
     # Method 3: Add ?export=csv query parameter
-    try:
-        response = session.post(url + '?export=csv', data={'division': division_param}, timeout=30)
-        response.raise_for_status()
-        if response.text.strip() and (',' in response.text[:100] or response.text.startswith('Game No')):
-            return response.text
-    except Exception:
-        pass
+    attempts = [
+        (url, {'division': division_param, 'format': 'csv'}, True),
+        (url.replace('.jsp', '.csv'), {'division': division_param}, False),
+        (url + '?export=csv', {'division': division_param}, False),
+    ]
     
+    # Only move on to the next method once the previous one has failed
+    for attempt_url, data, check_content_type in attempts:
+        if wait_for_slot is not None:
+            wait_for_slot()
+        csv_content = _fetch_csv(session, attempt_url, data, check_content_type)
+        if csv_content is not None:
+            return csv_content
     return None
-
@@ -6,9 +6,48 @@ This module parses the HTML response from seasons.jsp to extract
 the list of available divisions with their IDs and parameters, and
 also identifies available seasons to scrape.
 """
-from typing import List, Dict, Any, Set, Tuple
+from typing import List, Dict, Any, Set, Tuple, Callable
 from bs4 import BeautifulSoup
+from hashlib import blake2b
 import re
+import sys
+
+
+# Parsed results keyed by (parser name, digest of the HTML). The same
+# seasons.jsp page is fetched repeatedly during a scrape (e.g. once per
+# cached file when looking up division IDs), so repeats skip the parse.
+_PARSE_CACHE: Dict[Tuple[str, bytes], List[Dict[str, Any]]] = {}
+_PARSE_CACHE_SIZE = 32
+
+
+def _cached_parse(name: str, html_content: str,
+                  parse: Callable[[str], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """
+    Return parse(html_content), reusing the result for identical HTML.
+    
+    Parameters
+    ----------
+    name : str
+        Parser name, used to keep each parser's results separate
+    html_content : str
+        The HTML content to parse
+    parse : Callable[[str], List[Dict[str, Any]]]
+        Uncached parser
+        
+    Returns
+    -------
+    List[Dict[str, Any]]
+        Fresh copies of the cached dictionaries, safe for callers to modify
+    """
+    key = (name, blake2b(html_content.encode('utf-8', 'surrogatepass'), digest_size=16).digest())
+    result = _PARSE_CACHE.get(key)
+    if result is None:
+        result = parse(html_content)
+        if len(_PARSE_CACHE) >= _PARSE_CACHE_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            _PARSE_CACHE.pop(next(iter(_PARSE_CACHE)), None)
+        _PARSE_CACHE[key] = result
+    return [dict(item) for item in result]
 
 
 def parse_seasons_list(html_content: str) -> List[Dict[str, str]]:
@@ -30,6 +69,11 @@ def parse_seasons_list(html_content: str) -> List[Dict[str, str]]:
         - season_name: str
         - season_type: str
     """
+    return _cached_parse('seasons', html_content, _parse_seasons_list)
+
+
+def _parse_seasons_list(html_content: str) -> List[Dict[str, str]]:
+    """Uncached implementation of parse_seasons_list()."""
     soup = BeautifulSoup(html_content, 'html.parser')
     seasons: Set[Tuple[str, str, str]] = set()
     
@@ -43,7 +87,8 @@ def parse_seasons_list(html_content: str) -> List[Dict[str, str]]:
             if value and value != 'Seasons' and text and text != '-Select Season-':
                 # Parse season value format: "year_season,season_id1,season_id2,season_name"
                 # Example: "2025/2026 ,      2775,      2846,Fall 2025                     "
-                parts = value.split(',')
+                # Only the first four fields are used, so don't split the tail
+                parts = value.split(',', 4)
                 if len(parts) >= 4:
                     year_season = parts[0].strip()
                     season_id1 = parts[1].strip() if len(parts) > 1 else ''
@@ -69,7 +114,7 @@ def parse_seasons_list(html_content: str) -> List[Dict[str, str]]:
     
     # If no season selector, extract from divisions
     if not seasons:
-        divisions = parse_divisions(html_content)
+        divisions = _divisions_from_soup(soup)
         for div in divisions:
             seasons.add((
                 div['year_season'],
@@ -119,7 +164,28 @@ def parse_divisions(html_content: str) -> List[Dict[str, Any]]:
         - division_name: str (e.g., "U11 Boys 5th Division")
         - season_type: str (e.g., "F" for Fall)
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
+    return _cached_parse('divisions', html_content, _parse_divisions)
+
+
+def _parse_divisions(html_content: str) -> List[Dict[str, Any]]:
+    """Uncached implementation of parse_divisions()."""
+    return _divisions_from_soup(BeautifulSoup(html_content, 'html.parser'))
+
+
+def _divisions_from_soup(soup: BeautifulSoup) -> List[Dict[str, Any]]:
+    """
+    Extract divisions from an already-parsed seasons.jsp document.
+    
+    Parameters
+    ----------
+    soup : BeautifulSoup
+        Parsed seasons.jsp HTML
+        
+    Returns
+    -------
+    List[Dict[str, Any]]
+        Division dictionaries as described in parse_divisions()
+    """
     divisions: List[Dict[str, Any]] = []
     
     # Find the select element with division options
@@ -137,9 +203,17 @@ def parse_divisions(html_content: str) -> List[Dict[str, Any]]:
             continue
         
         # Parse the value format: "division_id,year/season,season_id1,season_id2,season_name,division_name,season_type"
-        parts = value.split(',')
+        # Only the first seven fields are used, so don't split the tail
+        parts = value.split(',', 7)
         if len(parts) >= 7:
             try:
+                division_id = parts[0].strip()
+                
+                # Validate division_id is present and not empty
+                if not division_id:
+                    # Skip divisions without valid division_id before any other work
+                    continue
+                
                 season_name = parts[4].strip()
                 season_type_from_html = parts[6].strip()
                 
@@ -153,14 +227,8 @@ def parse_divisions(html_content: str) -> List[Dict[str, Any]]:
                     # Fall back to HTML value
                     season_type = season_type_from_html if season_type_from_html in ('F', 'S') else 'F'
                 
-                division_id = parts[0].strip()
                 division_name = parts[5].strip()
                 
-                # Validate division_id is present and not empty
-                if not division_id:
-                    # Skip divisions without valid division_id
-                    continue
-                
                 # Validate division_name matches dropdown text (should be 1:1)
                 # Normalize both for comparison (remove extra whitespace)
                 text_normalized = ' '.join(text.split())
@@ -172,14 +240,15 @@ def parse_divisions(html_content: str) -> List[Dict[str, Any]]:
                     # Use dropdown text as division_name (it's the authoritative source)
                     division_name = text_normalized
                 
+                # Season fields are identical for every division in the page
                 divisions.append({
                     'division_id': division_id,
-                    'year_season': parts[1].strip(),  # Keep for POST requests only
-                    'season_id1': parts[2].strip(),
-                    'season_id2': parts[3].strip(),
-                    'season_name': season_name,
+                    'year_season': sys.intern(parts[1].strip()),  # Keep for POST requests only
+                    'season_id1': sys.intern(parts[2].strip()),
+                    'season_id2': sys.intern(parts[3].strip()),
+                    'season_name': sys.intern(season_name),
                     'division_name': division_name,
-                    'season_type': season_type,
+                    'season_type': sys.intern(season_type),
                     'display_name': text  # Display name from HTML option text
                 })
             except (IndexError, ValueError):
@@ -6,19 +6,149 @@ This module parses the HTML response from standings.jsp to extract:
 - Team standings (wins, losses, ties, points, goals, etc.)
 - Match results/schedule (dates, teams, scores, fields)
 """
-from typing import List, Dict, Any, Optional
-from bs4 import BeautifulSoup
+from typing import List, Dict, Any, Optional, Iterable, Tuple, Union
+from html import unescape
+from lxml import etree
 import re
 
+from .parse_csv import TeamRow, MatchRow
 
-def parse_team_standings(html_content: str) -> List[Dict[str, Any]]:
+
+# Character encoding of standings.jsp pages (used when parsing raw response bytes)
+PAGE_ENCODING = 'ISO-8859-1'
+
+# Compiled XPath lookups (compiled once at import, not per call)
+_TABLE_BY_ID = etree.XPath('//table[@id=$table_id]')
+_TABLE_ROWS = etree.XPath('.//tr')
+_TD_CELLS = etree.XPath('.//td')
+_TH_CELLS = etree.XPath('.//th')
+_ALL_CELLS = etree.XPath('.//th|.//td')
+_EXPORT_LINKS_DIV = etree.XPath('//div[contains(concat(" ", normalize-space(@class), " "), " exportlinks ")]')
+
+# Precompiled patterns and lookups used inside the per-cell loops
+_DATE_RE = re.compile(r'\d{2}-\d{2}-\d{2}')
+# A 4-digit run on the first line (same result as re.match(r'.*\d{4}') without the backtracking)
+_YEAR_RE = re.compile(r'\d{4}')
+_CSV_TEXT_RE = re.compile(r'CSV', re.I)
+_H1_RE = re.compile(r'<h1\b[^>]*>(.*?)</h1\s*>', re.DOTALL | re.IGNORECASE)
+_TAG_RE = re.compile(r'<[^>]*>')
+_DAYS = frozenset(('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'))
+
+
+def _parse_html(html_content: Union[str, bytes], encoding: str = PAGE_ENCODING) -> etree._Element:
     """
-    Parse team standings table from standings.jsp HTML.
+    Parse HTML into an lxml document tree.
+    
+    Uses the plain etree HTML parser rather than lxml.html: the extractors
+    only need the core element API, and skipping lxml.html's custom element
+    classes avoids a Python-level class lookup for every node they touch.
     
     Parameters
     ----------
-    html_content : str
+    html_content : Union[str, bytes]
         The HTML content from standings.jsp
+    encoding : str
+        Character encoding of bytes input (default: PAGE_ENCODING)
+        
+    Returns
+    -------
+    etree._Element
+        Root <html> element (empty if the content is blank)
+    """
+    if not html_content.strip():
+        return etree.Element('html')
+    if isinstance(html_content, bytes):
+        # Let libxml2 decode the raw body itself instead of building a str first
+        root = etree.HTML(html_content, parser=etree.HTMLParser(encoding=encoding))
+        return root if root is not None else etree.Element('html')
+    try:
+        root = etree.HTML(html_content)
+    except ValueError:
+        # lxml rejects str input that carries an XML encoding declaration
+        root = etree.HTML(html_content.encode('utf-8'), parser=etree.HTMLParser(encoding='utf-8'))
+    return root if root is not None else etree.Element('html')
+
+
+def parse_html_chunks(chunks: Iterable[bytes], encoding: str = PAGE_ENCODING) -> Tuple[etree._Element, bytes]:
+    """
+    Incrementally parse raw HTML bytes (e.g. a streamed HTTP response body).
+    
+    Each chunk is fed to lxml as it arrives, so the tree is built while the
+    rest of the body is still downloading instead of after a full str decode.
+    
+    Parameters
+    ----------
+    chunks : Iterable[bytes]
+        Body chunks, e.g. ``response.iter_content(chunk_size=65536)``
+    encoding : str
+        Character encoding of the body (default: PAGE_ENCODING)
+        
+    Returns
+    -------
+    Tuple[etree._Element, bytes]
+        Root <html> element and the complete raw body (for caching)
+    """
+    parser = etree.HTMLParser(encoding=encoding)
+    body = bytearray()
+    for chunk in chunks:
+        if chunk:
+            parser.feed(chunk)
+            body += chunk
+    try:
+        root = parser.close()
+    except etree.XMLSyntaxError:
+        # Blank body: no document element to return
+        root = etree.Element('html')
+    return root, bytes(body)
+
+
+def _text(element: etree._Element) -> str:
+    """Return an element's text with each fragment stripped (like bs4's get_text(strip=True))."""
+    if not len(element):
+        # Leaf element (most table cells): its only fragment is .text
+        text = element.text
+        return text.strip() if text else ''
+    return ''.join(fragment.strip() for fragment in element.itertext())
+
+
+def _parse_int(value: str) -> int:
+    """Parse integer value, handling empty strings and negative numbers."""
+    value = value.strip()
+    if not value:
+        return 0
+    # Handle negative numbers (e.g., "-1", " -21")
+    return int(value)
+
+
+def _parse_score(text: str) -> Optional[int]:
+    """Parse a score cell, returning None if it is blank or not a number."""
+    if text and text.strip():
+        try:
+            return int(text)
+        except ValueError:
+            pass
+    return None
+
+
+def _team_text(cell: etree._Element, text: str) -> str:
+    """Return a team cell's name: the link text if the cell has a link, else the cell text."""
+    link = cell.find('.//a')
+    return _text(link) if link is not None else text
+
+
+def _first(elements: List[etree._Element]) -> Optional[etree._Element]:
+    """Return the first element of an XPath result, or None."""
+    return elements[0] if elements else None
+
+
+def parse_team_standings(html_content: Union[str, bytes]) -> List[Dict[str, Any]]:
+    """
+    Parse team standings table from standings.jsp HTML.
+    
+    Parameters
+    ----------
+    html_content : Union[str, bytes]
+        The HTML content from standings.jsp (bytes are decoded as PAGE_ENCODING)
         
     Returns
     -------
@@ -34,59 +164,44 @@ def parse_team_standings(html_content: str) -> List[Dict[str, Any]]:
         - goals_against: int
         - goal_differential: int
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
-    teams: List[Dict[str, Any]] = []
+    return [team.as_dict() for team in _parse_team_standings(_parse_html(html_content))]
+
+
+def _parse_team_standings(root: etree._Element) -> List[TeamRow]:
+    """Implementation of parse_team_standings() on an already-parsed page, as records."""
+    teams: List[TeamRow] = []
     
     # Find the standings table (table with id="row")
-    standings_table = soup.find('table', id='row')
-    if not standings_table:
+    standings_table = _first(_TABLE_BY_ID(root, table_id='row'))
+    if standings_table is None:
         return teams
     
     # Find all table rows in tbody
-    tbody = standings_table.find('tbody')
-    if not tbody:
+    tbody = standings_table.find('.//tbody')
+    if tbody is None:
         return teams
     
-    rows = tbody.find_all('tr')
+    rows = _TABLE_ROWS(tbody)
     for row in rows:
-        cells = row.find_all('td')
+        cells = _TD_CELLS(row)
         if len(cells) >= 9:  # Team, W, L, T, F, PTS, GF, GA, GD
             try:
-                team_name = cells[0].get_text(strip=True)
+                # Extract each cell's text once, then index
+                texts = [_text(cell) for cell in cells[:9]]
+                team_name = texts[0]
                 
                 # Skip rows with empty team names
                 if not team_name:
                     continue
                 
                 # Parse numeric values, handling negative numbers and empty strings
-                def parse_int(value: str) -> int:
-                    """Parse integer value, handling empty strings and negative numbers."""
-                    value = value.strip()
-                    if not value:
-                        return 0
-                    # Handle negative numbers (e.g., "-1", " -21")
-                    return int(value)
-                
-                wins = parse_int(cells[1].get_text(strip=True))
-                losses = parse_int(cells[2].get_text(strip=True))
-                ties = parse_int(cells[3].get_text(strip=True))
-                forfeits = parse_int(cells[4].get_text(strip=True))
-                points = parse_int(cells[5].get_text(strip=True))
-                goals_for = parse_int(cells[6].get_text(strip=True))
-                goals_against = parse_int(cells[7].get_text(strip=True))
-                goal_differential = parse_int(cells[8].get_text(strip=True))
+                (wins, losses, ties, forfeits, points,
+                 goals_for, goals_against, goal_differential) = [_parse_int(text) for text in texts[1:9]]
                 
-                teams.append({
-                    'team_name': team_name,
-                    'wins': wins,
-                    'losses': losses,
-                    'ties': ties,
-                    'forfeits': forfeits,
-                    'points': points,
-                    'goals_for': goals_for,
-                    'goals_against': goals_against,
-                    'goal_differential': goal_differential
-                })
+                teams.append(TeamRow(
+                    team_name, wins, losses, ties, forfeits, points,
+                    goals_for, goals_against, goal_differential
+                ))
             except (ValueError, IndexError) as e:
                 # Skip rows that don't match expected format
                 continue
@@ -94,7 +209,7 @@ def parse_team_standings(html_content: str) -> List[Dict[str, Any]]:
     return teams
 
 
-def parse_match_results(html_content: str) -> List[Dict[str, Any]]:
+def parse_match_results(html_content: Union[str, bytes]) -> List[Dict[str, Any]]:
     """
     Parse match results/schedule table from standings.jsp HTML.
     
@@ -103,8 +218,8 @@ def parse_match_results(html_content: str) -> List[Dict[str, Any]]:
     
     Parameters
     ----------
-    html_content : str
-        The HTML content from standings.jsp
+    html_content : Union[str, bytes]
+        The HTML content from standings.jsp (bytes are decoded as PAGE_ENCODING)
         
     Returns
     -------
@@ -119,25 +234,29 @@ def parse_match_results(html_content: str) -> List[Dict[str, Any]]:
         - away_score: Optional[int]
         - status: str (scheduled/completed)
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
-    matches: List[Dict[str, Any]] = []
+    return [match.as_dict() for match in _parse_match_results(_parse_html(html_content))]
+
+
+def _parse_match_results(root: etree._Element) -> List[MatchRow]:
+    """Implementation of parse_match_results() on an already-parsed page, as records."""
+    matches: List[MatchRow] = []
     
     # First, try to find table with id="row2" (original expected structure)
-    schedule_table = soup.find('table', id='row2')
+    schedule_table = _first(_TABLE_BY_ID(root, table_id='row2'))
     
     # If not found, check if match data is in the same standings table (id="row")
     # The "Game No" table might be in the same table, separated by a header row
-    if not schedule_table:
-        standings_table = soup.find('table', id='row')
-        if standings_table:
+    if schedule_table is None:
+        standings_table = _first(_TABLE_BY_ID(root, table_id='row'))
+        if standings_table is not None:
             # Check if this table contains match data rows after the team standings
             # Look for a header row containing "Game No"
-            all_rows = standings_table.find_all('tr')
+            all_rows = _TABLE_ROWS(standings_table)
             match_start_row = None
             
             for i, row in enumerate(all_rows):
-                cells = row.find_all(['th', 'td'])
-                cell_texts = [cell.get_text(strip=True).lower() for cell in cells]
+                cells = _ALL_CELLS(row)
+                cell_texts = [_text(cell).lower() for cell in cells]
                 # Check if this row looks like a match header (contains "Game No" or similar)
                 row_text = ' '.join(cell_texts)
                 if any(keyword in row_text for keyword in ['game no', 'game', 'date', 'time', 'home', 'away', 'score']):
@@ -153,15 +272,15 @@ def parse_match_results(html_content: str) -> List[Dict[str, Any]]:
                 pass
     
     # If still not found, look for any other table that contains "Game No" or match-related headers
-    if not schedule_table:
-        all_tables = soup.find_all('table')
+    if schedule_table is None:
+        all_tables = root.iter('table')
         for table in all_tables:
             # Check if this table contains "Game No" or match-related headers
-            table_text = table.get_text()
+            table_text = ''.join(table.itertext())
             headers = []
-            thead = table.find('thead')
-            if thead:
-                headers = [th.get_text(strip=True).lower() for th in thead.find_all(['th', 'td'])]
+            thead = table.find('.//thead')
+            if thead is not None:
+                headers = [_text(th).lower() for th in _ALL_CELLS(thead)]
             
             # Check for match-related keywords
             if any(keyword in ' '.join(headers).lower() or keyword in table_text.lower() 
@@ -172,24 +291,24 @@ def parse_match_results(html_content: str) -> List[Dict[str, Any]]:
                     break
             
             # Also check first row for match headers
-            first_row = table.find('tr')
-            if first_row:
-                first_row_cells = [cell.get_text(strip=True).lower() for cell in first_row.find_all(['th', 'td'])]
+            first_row = table.find('.//tr')
+            if first_row is not None:
+                first_row_cells = [_text(cell).lower() for cell in _ALL_CELLS(first_row)]
                 if any(keyword in ' '.join(first_row_cells) 
                        for keyword in ['game no', 'game', 'date', 'home', 'away']):
                     if table.get('id') != 'row':
                         schedule_table = table
                         break
     
-    if not schedule_table:
+    if schedule_table is None:
         return matches
     
     # Find all table rows in tbody (or in the table itself if no tbody)
-    tbody = schedule_table.find('tbody')
-    if tbody:
-        rows = tbody.find_all('tr')
+    tbody = schedule_table.find('.//tbody')
+    if tbody is not None:
+        rows = _TABLE_ROWS(tbody)
     else:
-        rows = schedule_table.find_all('tr')
+        rows = _TABLE_ROWS(schedule_table)
     
     if not rows:
         return matches
@@ -199,230 +318,126 @@ def parse_match_results(html_content: str) -> List[Dict[str, Any]]:
     match_started = False
     
     for row in rows:
-        cells = row.find_all('td')
+        cells = _TD_CELLS(row)
         if not cells:
             # Try th cells if no td cells
-            cells = row.find_all('th')
+            cells = _TH_CELLS(row)
+        
+        # Match rows have at least 7 cells; anything shorter is neither a match nor a header
+        if len(cells) < 7:
+            continue
+        
+        # Extract each cell's text once; everything below indexes into this list
+        texts = [_text(cell) for cell in cells]
         
         # If we're in the standings table, skip rows that look like team standings
         if skip_team_rows and not match_started:
             # Team rows have 9 cells with specific structure
             if len(cells) == 9:
                 # Check if this row looks like a match header instead
-                cell_texts = [cell.get_text(strip=True).lower() for cell in cells]
-                row_text = ' '.join(cell_texts)
+                row_text = ' '.join(texts).lower()
                 if any(keyword in row_text for keyword in ['game no', 'game', 'date', 'time']):
                     match_started = True
                 else:
                     # This is a team row, skip it
                     continue
-            elif len(cells) >= 7:
+            else:
                 # Different number of cells, might be match data
                 match_started = True
         
+        # A match row needs a date cell; one C-level search over the joined texts
+        # rejects headers and spacer rows before the per-cell walk below
+        if _DATE_RE.search(' '.join(texts)) is None:
+            continue
+        
         # Expected columns: Game No, Day, Date, Time, Home Team, Home Score, Away Score, Away Team, Field
         # Some rows might have match ID in first cell, so we need to handle variable number of cells
-        if len(cells) >= 7:
-            try:
-                # Find day, date, time - these are typically in cells 1, 2, 3 or 0, 1, 2
-                # The "Game No" table might have: Game No, Day, Date, Time, Home Team, Home Score, Away Score, Away Team, Field
-                # Or it might start with Game No in first cell
-                
-                # First, check if first cell is "Game No" or a game number - if so, skip it
-                start_idx = 0
-                first_cell_text = cells[0].get_text(strip=True).lower() if cells else ''
-                if 'game' in first_cell_text or (first_cell_text.isdigit() and len(first_cell_text) <= 3):
-                    start_idx = 1  # Skip Game No column
-                
-                day = ''
-                date = ''
-                time = ''
-                home_idx = -1
-                
-                # Look for date and time starting from start_idx
-                for i in range(start_idx, len(cells)):
-                    cell = cells[i]
-                    text = cell.get_text(strip=True)
-                    # Check if it's a day of week
-                    if text in ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']:
-                        day = text
-                        # Date should be next cell
-                        if i + 1 < len(cells):
-                            date_text = cells[i + 1].get_text(strip=True)
-                            if re.match(r'\d{2}-\d{2}-\d{2}', date_text):
-                                date = date_text
-                                # Time should be after date
-                                if i + 2 < len(cells):
-                                    time = cells[i + 2].get_text(strip=True)
-                                home_idx = i + 3
+        try:
+            n = len(texts)
+            
+            # First, check if first cell is "Game No" or a game number - if so, skip it
+            start_idx = 0
+            first_cell_text = texts[0].lower()
+            if 'game' in first_cell_text or (first_cell_text.isdigit() and len(first_cell_text) <= 3):
+                start_idx = 1  # Skip Game No column
+            
+            # Single walk to locate the date cell. A date directly after the first
+            # day-of-week cell wins; otherwise the first date-looking cell is used.
+            day = ''
+            date = ''
+            time = ''
+            date_idx = -1
+            day_found = False
+            for i in range(start_idx, n):
+                text = texts[i]
+                if not day_found and text in _DAYS:
+                    day_found = True
+                    day = text
+                    if i + 1 < n and _DATE_RE.match(texts[i + 1]):
+                        date_idx = i + 1
                         break
-                
-                # If we didn't find day, try to find date directly
-                if not date:
-                    for i in range(start_idx, len(cells)):
-                        cell = cells[i]
-                        text = cell.get_text(strip=True)
-                        if re.match(r'\d{2}-\d{2}-\d{2}', text):
-                            date = text
-                            # Previous cell might be day
-                            if i > start_idx:
-                                prev_text = cells[i - 1].get_text(strip=True)
-                                if prev_text in ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']:
-                                    day = prev_text
-                            # Next cell should be time
-                            if i + 1 < len(cells):
-                                time = cells[i + 1].get_text(strip=True)
-                            home_idx = i + 2
-                            break
-                
-                # Find home team, scores, away team, and field
-                # Structure: Game No, Day, Date, Time, Home Team, Home Score, Away Score, Away Team, Field
-                home_team = ''
-                home_score: Optional[int] = None
-                away_score: Optional[int] = None
-                away_team = ''
-                field = ''
-                
-                # If we found date/time, the structure should be:
-                # start_idx = Game No (if present)
-                # start_idx+1 = Day
-                # start_idx+2 = Date (if we found it)
-                # start_idx+3 = Time
-                # start_idx+4 = Home Team
-                # start_idx+5 = Home Score
-                # start_idx+6 = Away Score
-                # start_idx+7 = Away Team
-                # start_idx+8 = Field
-                
-                # If we found date, calculate indices based on that
-                if date:
-                    # We found date at index i, so:
-                    # i-1 = Day (or start_idx if day wasn't found)
-                    # i = Date
-                    # i+1 = Time
-                    # i+2 = Home Team
-                    # i+3 = Home Score
-                    # i+4 = Away Score
-                    # i+5 = Away Team
-                    # i+6 = Field
-                    date_idx = -1
-                    for idx in range(start_idx, len(cells)):
-                        if cells[idx].get_text(strip=True) == date:
-                            date_idx = idx
-                            break
-                    
                     if date_idx >= 0:
-                        # Home team is 2 cells after date
-                        if date_idx + 2 < len(cells):
-                            home_cell = cells[date_idx + 2]
-                            home_link = home_cell.find('a')
-                            if home_link:
-                                home_team = home_link.get_text(strip=True)
-                            else:
-                                home_team = home_cell.get_text(strip=True)
-                        
-                        # Home score is 3 cells after date
-                        if date_idx + 3 < len(cells):
-                            score_text = cells[date_idx + 3].get_text(strip=True)
-                            if score_text and score_text.strip():
-                                try:
-                                    home_score = int(score_text)
-                                except ValueError:
-                                    pass
-                        
-                        # Away score is 4 cells after date
-                        if date_idx + 4 < len(cells):
-                            score_text = cells[date_idx + 4].get_text(strip=True)
-                            if score_text and score_text.strip():
-                                try:
-                                    away_score = int(score_text)
-                                except ValueError:
-                                    pass
-                        
-                        # Away team is 5 cells after date
-                        if date_idx + 5 < len(cells):
-                            away_cell = cells[date_idx + 5]
-                            away_link = away_cell.find('a')
-                            if away_link:
-                                away_team = away_link.get_text(strip=True)
-                            else:
-                                away_team = away_cell.get_text(strip=True)
-                        
-                        # Field is 6 cells after date
-                        if date_idx + 6 < len(cells):
-                            field = cells[date_idx + 6].get_text(strip=True)
-                elif home_idx >= 0:
-                    # Fallback: try to find home team at the expected index
-                    if home_idx < len(cells):
-                        home_cell = cells[home_idx]
-                        home_link = home_cell.find('a')
-                        if home_link:
-                            home_team = home_link.get_text(strip=True)
-                        else:
-                            home_team = home_cell.get_text(strip=True)
-                        
-                        # Home score should be in next cell
-                        if home_idx + 1 < len(cells):
-                            score_text = cells[home_idx + 1].get_text(strip=True)
-                            if score_text and score_text.strip():
-                                try:
-                                    home_score = int(score_text)
-                                except ValueError:
-                                    pass
-                        
-                        # Away score should be after home score
-                        if home_idx + 2 < len(cells):
-                            score_text = cells[home_idx + 2].get_text(strip=True)
-                            if score_text and score_text.strip():
-                                try:
-                                    away_score = int(score_text)
-                                except ValueError:
-                                    pass
-                        
-                        # Away team should be after scores
-                        away_idx = home_idx + 3
-                        if away_idx < len(cells):
-                            away_cell = cells[away_idx]
-                            away_link = away_cell.find('a')
-                            if away_link:
-                                away_team = away_link.get_text(strip=True)
-                            else:
-                                away_team = away_cell.get_text(strip=True)
-                        
-                        # Field should be last cell
-                        if len(cells) > away_idx + 1:
-                            field = cells[away_idx + 1].get_text(strip=True)
-                
-                # Determine status
-                status = 'completed' if (home_score is not None and away_score is not None) else 'scheduled'
+                        break
+                elif date_idx < 0 and _DATE_RE.match(text):
+                    date_idx = i
+                    if day_found:
+                        break
+            
+            # Find home team, scores, away team, and field relative to the date:
+            # Date, Time, Home Team, Home Score, Away Score, Away Team, Field
+            home_team = ''
+            home_score: Optional[int] = None
+            away_score: Optional[int] = None
+            away_team = ''
+            field = ''
+            
+            if date_idx >= 0:
+                date = texts[date_idx]
+                # Previous cell might be day
+                if date_idx > start_idx and texts[date_idx - 1] in _DAYS:
+                    day = texts[date_idx - 1]
+                # Next cell should be time
+                if date_idx + 1 < n:
+                    time = texts[date_idx + 1]
                 
-                # Only add if we have essential data
-                if date and home_team and away_team:
-                    matches.append({
-                        'date': f"{day} {date}" if day else date,
-                        'time': time,
-                        'home_team': home_team,
-                        'away_team': away_team,
-                        'field': field,
-                        'home_score': home_score,
-                        'away_score': away_score,
-                        'status': status
-                    })
-            except (ValueError, IndexError) as e:
-                # Skip rows that don't match expected format
-                continue
+                # Columns are counted from the first cell holding this date
+                date_idx = texts.index(date, start_idx)
+                if date_idx + 2 < n:
+                    home_team = _team_text(cells[date_idx + 2], texts[date_idx + 2])
+                if date_idx + 3 < n:
+                    home_score = _parse_score(texts[date_idx + 3])
+                if date_idx + 4 < n:
+                    away_score = _parse_score(texts[date_idx + 4])
+                if date_idx + 5 < n:
+                    away_team = _team_text(cells[date_idx + 5], texts[date_idx + 5])
+                if date_idx + 6 < n:
+                    field = texts[date_idx + 6]
+            
+            # Determine status
+            status = 'completed' if (home_score is not None and away_score is not None) else 'scheduled'
+            
+            # Only add if we have essential data
+            if date and home_team and away_team:
+                matches.append(MatchRow(
+                    f"{day} {date}" if day else date,
+                    time, home_team, away_team, field,
+                    home_score, away_score, status
+                ))
+        except (ValueError, IndexError) as e:
+            # Skip rows that don't match expected format
+            continue
     
     return matches
 
 
-def parse_division_info(html_content: str) -> Dict[str, str]:
+def parse_division_info(html_content: Union[str, bytes]) -> Dict[str, str]:
     """
     Parse division information from standings.jsp HTML.
     
     Parameters
     ----------
-    html_content : str
-        The HTML content from standings.jsp
+    html_content : Union[str, bytes]
+        The HTML content from standings.jsp (bytes are decoded as PAGE_ENCODING)
         
     Returns
     -------
@@ -431,23 +446,37 @@ def parse_division_info(html_content: str) -> Dict[str, str]:
         - division_name: str
         - season: str
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
+    # Only <h1> text is needed, so scan the raw HTML instead of building a tree
+    if isinstance(html_content, bytes):
+        html_content = html_content.decode(PAGE_ENCODING)
+    headings = (
+        ''.join(unescape(fragment).strip() for fragment in _TAG_RE.split(match.group(1)))
+        for match in _H1_RE.finditer(html_content)
+    )
+    return _classify_headings(headings)
+
+
+def _parse_division_info(root: etree._Element) -> Dict[str, str]:
+    """Implementation of parse_division_info() on an already-parsed page."""
+    return _classify_headings(_text(h1) for h1 in root.iter('h1'))
+
+
+def _classify_headings(headings: Iterable[str]) -> Dict[str, str]:
+    """Pick the division name and season out of the page's <h1> texts."""
     info: Dict[str, str] = {}
     
     # Look for h1 tags that contain division and season info
-    h1_tags = soup.find_all('h1')
-    for h1 in h1_tags:
-        text = h1.get_text(strip=True)
+    for text in headings:
         if text:
             if 'division' in text.lower() or 'boys' in text.lower() or 'girls' in text.lower():
                 info['division_name'] = text
-            elif re.match(r'.*\d{4}', text):  # Looks like a year/season
+            elif _YEAR_RE.search(text.partition('\n')[0]):  # Looks like a year/season
                 info['season'] = text
     
     return info
 
 
-def parse_csv_link(html_content: str) -> Optional[str]:
+def parse_csv_link(html_content: Union[str, bytes]) -> Optional[str]:
     """
     Parse CSV download link from standings.jsp HTML.
     
@@ -456,35 +485,39 @@ def parse_csv_link(html_content: str) -> Optional[str]:
     
     Parameters
     ----------
-    html_content : str
-        The HTML content from standings.jsp
+    html_content : Union[str, bytes]
+        The HTML content from standings.jsp (bytes are decoded as PAGE_ENCODING)
         
     Returns
     -------
     Optional[str]
         CSV download URL (relative or absolute), or None if not found
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
-    
+    return _parse_csv_link(_parse_html(html_content))
+
+
+def _parse_csv_link(root: etree._Element) -> Optional[str]:
+    """Implementation of parse_csv_link() on an already-parsed page."""
     # Find the exportlinks div
-    export_div = soup.find('div', class_='exportlinks')
-    if not export_div:
+    export_div = _first(_EXPORT_LINKS_DIV(root))
+    if export_div is None:
         return None
     
     # Find the CSV link (has class "export csv")
-    csv_link = export_div.find('a', class_='export csv')
-    if not csv_link:
+    csv_link = export_div.find('.//a[@class="export csv"]')
+    if csv_link is None:
         # Try alternative: look for link containing "csv" in text or class
-        csv_link = export_div.find('a', string=re.compile(r'CSV', re.I))
-        if not csv_link:
+        csv_link = next((link for link in export_div.iter('a')
+                         if len(link) == 0 and link.text and _CSV_TEXT_RE.search(link.text)), None)
+        if csv_link is None:
             # Try finding any link with "csv" in href
-            for link in export_div.find_all('a'):
+            for link in export_div.iter('a'):
                 href = link.get('href', '')
                 if 'csv' in href.lower() or 'd-49682-e=1' in href:
                     csv_link = link
                     break
     
-    if csv_link:
+    if csv_link is not None:
         href = csv_link.get('href', '')
         if href:
             # Make it absolute URL if it's relative
@@ -498,14 +531,17 @@ def parse_csv_link(html_content: str) -> Optional[str]:
     return None
 
 
-def parse_standings(html_content: str) -> Dict[str, Any]:
+def parse_standings(html_content: Union[str, bytes], encoding: str = PAGE_ENCODING) -> Dict[str, Any]:
     """
     Parse complete standings.jsp HTML to extract all data.
     
     Parameters
     ----------
-    html_content : str
+    html_content : Union[str, bytes]
         The HTML content from standings.jsp
+    encoding : str
+        Character encoding of bytes input (default: PAGE_ENCODING, the raw
+        response; cache files are UTF-8)
         
     Returns
     -------
@@ -516,10 +552,28 @@ def parse_standings(html_content: str) -> Dict[str, Any]:
         - matches: List[Dict[str, Any]]
         - csv_link: Optional[str] - CSV download URL
     """
+    # Parse the page once and share the tree between the extractors
+    return parse_standings_from_tree(_parse_html(html_content, encoding))
+
+
+def parse_standings_from_tree(root: etree._Element) -> Dict[str, Any]:
+    """
+    Extract all standings data from an already-parsed standings.jsp page.
+    
+    Parameters
+    ----------
+    root : etree._Element
+        Root element from parse_html_chunks() (or any lxml HTML document)
+        
+    Returns
+    -------
+    Dict[str, Any]
+        Same structure as parse_standings()
+    """
     return {
-        'division_info': parse_division_info(html_content),
-        'teams': parse_team_standings(html_content),
-        'matches': parse_match_results(html_content),
-        'csv_link': parse_csv_link(html_content)
+        'division_info': _parse_division_info(root),
+        'teams': [team.as_dict() for team in _parse_team_standings(root)],
+        'matches': [match.as_dict() for match in _parse_match_results(root)],
+        'csv_link': _parse_csv_link(root)
     }
 
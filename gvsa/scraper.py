@@ -6,11 +6,16 @@ This module scrapes the gvsoccer.org website to extract teams and match results
 for all divisions. It handles the frame-based structure by making direct requests
 to the JSP endpoints.
 """
-from typing import List, Dict, Any, Optional, Tuple
+from typing import Callable, List, Dict, Any, Optional, Tuple, Set, Union
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 import time
 import re
 import json
+import gzip
+import queue
 import sys
 import os
 import traceback
@@ -19,11 +24,12 @@ import signal
 import threading
 import pdb
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from hashlib import blake2b
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from threading import Lock
 
 from .parse_seasons import parse_divisions, parse_seasons_list
-from .parse_standings import parse_standings, parse_csv_link
+from .parse_standings import PAGE_ENCODING, parse_standings, parse_standings_from_tree, parse_html_chunks, parse_csv_link
 from .parse_csv import parse_csv_standings, download_csv_standings
 from .db_pony import GVSA_Database
 
@@ -33,6 +39,35 @@ try:
 except ImportError:
     HAS_FUZZ = False
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Tables/patterns used for cache file names and paths (built once, not per call)
+_INVALID_FILENAME_CHARS = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+_SEASON_YEAR_RE = re.compile(r'\b(20\d{2})\b')
+# Season type codes from the site ("F"/"S") and their normalized names, which map to themselves
+_SEASON_TYPE_NAMES = {'F': 'Fall', 'S': 'Spring', 'Fall': 'Fall', 'Spring': 'Spring'}
+# standings.jsp 'division' POST parameter, with exact spacing/padding as seen in mitm logs
+# Format: "      2843,2025/2026 ,      2775,      2846,Fall 2025                     ,U17/18/19 Girls Elite         ,F"
+# IDs: 10 chars (7 spaces + 3-4 digits), Names: 30 chars, Year: 10 chars (with trailing space)
+_DIVISION_PARAM_FORMAT = '{:>10},{} ,{:>10},{:>10},{:<30},{:<30},{}'.format
+
+
+def _dumps_metadata(metadata: Dict[str, Any]) -> str:
+    """Serialize cache metadata as 2-space-indented JSON (orjson when installed)."""
+    if HAS_ORJSON:
+        return orjson.dumps(metadata, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(metadata, indent=2)
+
+
+def _loads_metadata(content: bytes) -> Any:
+    """Deserialize cache metadata read as raw bytes (orjson when installed)."""
+    return orjson.loads(content) if HAS_ORJSON else json.loads(content)
+
+
 # Enable faulthandler to dump stack traces on hang
 faulthandler.enable()
 
@@ -60,8 +95,15 @@ class GVSAScraper:
     
     BASE_URL = "https://www.gvsoccer.org"
     CACHE_DIR = Path("html_cache")
+    # seasons.jsp listings change rarely; reuse a cached copy for this long (seconds)
+    LISTING_CACHE_TTL = 3600
+    # Divisions saved per database transaction when importing the cache
+    DB_BATCH_SIZE = 50
+    # Failed CSV exports in a season (with none succeeding) before get_standings stops trying CSV there
+    CSV_PROBE_LIMIT = 3
     
-    def __init__(self, delay: float = 1.0, use_cache: bool = True, max_workers: int = 5) -> None:
+    def __init__(self, delay: float = 1.0, use_cache: bool = True, max_workers: int = 5,
+                 compress_cache: bool = False) -> None:
         """
         Initialize the scraper.
         
@@ -73,26 +115,77 @@ class GVSAScraper:
             Whether to use cached HTML files (default: True)
         max_workers : int
             Maximum number of parallel workers for fetching (default: 5)
+        compress_cache : bool
+            Store newly fetched HTML as gzip-compressed ``.html.gz`` files
+            (default: False). Both forms are always readable.
         """
         self.delay = delay
         self.use_cache = use_cache
         self.max_workers = max_workers
+        self.compress_cache = compress_cache
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64; rv:144.0) Gecko/20100101 Firefox/144.0',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate, br',
+            # Only advertise encodings urllib3 can decode here (br/zstd need brotli/zstandard)
+            'Accept-Encoding': ACCEPT_ENCODING,
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1'
         })
         
+        # One keep-alive pool shared by all worker threads, one connection per
+        # worker (each worker has at most one request in flight, so workers wait
+        # for a free connection instead of opening throwaway ones), with retries
+        # for transient 5xx responses. The standings/seasons POSTs are read-only
+        # queries, so retrying them is safe.
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=max(max_workers, 1),
+            pool_block=True,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[500, 502, 503, 504],
+                allowed_methods=frozenset(['GET', 'POST'])
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
         # Create cache directory if it doesn't exist
         if self.use_cache:
             self.CACHE_DIR.mkdir(exist_ok=True)
         
-        # Thread lock for cache operations (though file I/O is generally safe)
-        self.cache_lock = Lock()
+        # Cache directories already created by get_cache_path (skips repeated mkdir calls;
+        # a race only costs a duplicate mkdir(exist_ok=True))
+        self._created_cache_dirs: Set[Path] = set()
+        
+        # CSV export capability per season (keyed by season_id1): True once an export
+        # worked, False after CSV_PROBE_LIMIT failures without a success
+        self._csv_available: Dict[str, bool] = {}
+        self._csv_failures: Dict[str, int] = {}
+        self._csv_lock = Lock()
+        
+        # Shared request pacing: workers reserve start slots instead of sleeping after each fetch
+        self._rate_lock = Lock()
+        self._next_request_time = 0.0
+    
+    def _wait_for_request_slot(self) -> None:
+        """
+        Block until this thread may send its next request to the server.
+        
+        Request starts are spaced ``delay / max_workers`` seconds apart across
+        all workers, which keeps the same overall request rate as sleeping
+        ``delay`` seconds in each worker without holding a thread idle after
+        its response has arrived.
+        """
+        with self._rate_lock:
+            now = time.monotonic()
+            start = max(now, self._next_request_time)
+            self._next_request_time = start + self.delay / max(self.max_workers, 1)
+        if start > now:
+            time.sleep(start - now)
     
     @staticmethod
     def sanitize_filename(name: str) -> str:
@@ -110,16 +203,127 @@ class GVSAScraper:
             Sanitized filename-safe string
         """
         # Remove or replace invalid filename characters
-        sanitized = re.sub(r'[<>:"/\\|?*]', '_', name)
-        sanitized = re.sub(r'\s+', '_', sanitized)
+        sanitized = name.translate(_INVALID_FILENAME_CHARS)
+        # Collapse whitespace runs to '_' (edge runs are stripped below either way)
+        sanitized = '_'.join(sanitized.split())
         sanitized = sanitized.strip('._')
         return sanitized
     
+    @staticmethod
+    def _atomic_write_text(path: Path, content: str) -> None:
+        """
+        Write a cache file via a temporary file and an atomic rename.
+        
+        Readers see either the old file or the complete new one, so cache
+        reads need no lock.
+        
+        Parameters
+        ----------
+        path : Path
+            Destination file
+        content : str
+            Text to write (UTF-8)
+        """
+        GVSAScraper._atomic_write_bytes(path, content.encode('utf-8'))
+    
+    @staticmethod
+    def _atomic_write_bytes(path: Path, data: bytes) -> None:
+        """
+        Write raw bytes to a cache file via a temporary file and an atomic rename.
+        
+        Parameters
+        ----------
+        path : Path
+            Destination file
+        data : bytes
+            Bytes to write
+        """
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+    
+    @staticmethod
+    def read_html_cache_bytes(html_path: Path) -> Optional[bytes]:
+        """
+        Read a cached HTML file as UTF-8 bytes, falling back to its gzip-compressed form.
+        
+        Parameters
+        ----------
+        html_path : Path
+            Path of the plain ``.html`` cache file; ``{html_path}.gz`` is
+            tried when it does not exist
+            
+        Returns
+        -------
+        Optional[bytes]
+            Cached HTML content (UTF-8) or None if neither file exists
+        """
+        try:
+            return html_path.read_bytes()
+        except FileNotFoundError:
+            pass
+        try:
+            data = html_path.with_name(html_path.name + '.gz').read_bytes()
+        except FileNotFoundError:
+            return None
+        return gzip.decompress(data)
+    
+    @staticmethod
+    def read_html_cache_file(html_path: Path) -> Optional[str]:
+        """
+        Read a cached HTML file, falling back to its gzip-compressed form.
+        
+        Parameters
+        ----------
+        html_path : Path
+            Path of the plain ``.html`` cache file; ``{html_path}.gz`` is
+            tried when it does not exist
+            
+        Returns
+        -------
+        Optional[str]
+            Cached HTML content or None if neither file exists
+        """
+        data = GVSAScraper.read_html_cache_bytes(html_path)
+        if data is None:
+            return None
+        return data.decode('utf-8')
+    
+    @staticmethod
+    def _build_division_param(division: Dict[str, Any]) -> str:
+        """
+        Build the standings.jsp 'division' POST parameter for a division.
+        
+        Parameters
+        ----------
+        division : Dict[str, Any]
+            Division dictionary from get_divisions()
+            
+        Returns
+        -------
+        str
+            Comma-separated, space-padded division parameter
+        """
+        return _DIVISION_PARAM_FORMAT(
+            str(division['division_id']),
+            division['year_season'],
+            str(division['season_id1']),
+            str(division['season_id2']),
+            division['season_name'],
+            division['division_name'],
+            division['season_type']
+        )
+    
     def get_cache_path(self, division: Dict[str, Any]) -> Tuple[Path, Path, Path]:
         """
         Get the cache file paths for a division (HTML, metadata, and CSV).
         
         Structure: html_cache/{year}_{season_type}/{division_name}.html
+        (or {division_name}.html.gz when compress_cache is enabled)
         Metadata: html_cache/{year}_{season_type}/{division_name}.json
         CSV: html_cache/{year}_{season_type}/{division_name}.csv
         
@@ -140,20 +344,22 @@ class GVSAScraper:
         year = 'unknown'
         if season_name:
             # Try to extract year from season_name (e.g., "Fall 2025" -> "2025")
-            year_match = re.search(r'\b(20\d{2})\b', season_name)
+            year_match = _SEASON_YEAR_RE.search(season_name)
             if year_match:
                 year = year_match.group(1)
         
         # Get season type: "F" -> "Fall", "S" -> "Spring"
         season_type_code = division.get('season_type', 'F')
-        season_type = 'Fall' if season_type_code == 'F' else 'Spring'
+        season_type = _SEASON_TYPE_NAMES.get(season_type_code, 'Spring')
         
         # Create cache directory: {year}_{season_type}
         cache_dir_name = f"{year}_{season_type}"
         division_name = self.sanitize_filename(division.get('division_name', division.get('display_name', 'unknown')))
         
         cache_dir = self.CACHE_DIR / cache_dir_name
-        cache_dir.mkdir(parents=True, exist_ok=True)
+        if cache_dir not in self._created_cache_dirs:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            self._created_cache_dirs.add(cache_dir)
         
         html_path = cache_dir / f"{division_name}.html"
         json_path = cache_dir / f"{division_name}.json"
@@ -180,16 +386,11 @@ class GVSAScraper:
         
         html_path, _, _ = self.get_cache_path(division)
         
-        with self.cache_lock:
-            if html_path.exists():
-                try:
-                    content = html_path.read_text(encoding='utf-8')
-                    return content
-                except Exception as e:
-                    print(f"  - Error reading cache: {e}")
-                    return None
-        
-        return None
+        try:
+            return self.read_html_cache_file(html_path)
+        except Exception as e:
+            print(f"  - Error reading cache: {e}")
+            return None
     
     def get_cached_metadata(self, division: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -210,18 +411,17 @@ class GVSAScraper:
         
         _, json_path, _ = self.get_cache_path(division)
         
-        with self.cache_lock:
-            if json_path.exists():
-                try:
-                    content = json_path.read_text(encoding='utf-8')
-                    return json.loads(content)
-                except Exception as e:
-                    print(f"  - Error reading metadata: {e}")
-                    return None
+        if json_path.exists():
+            try:
+                return _loads_metadata(json_path.read_bytes())
+            except Exception as e:
+                print(f"  - Error reading metadata: {e}")
+                return None
         
         return None
     
-    def save_html_cache(self, division: Dict[str, Any], html_content: str) -> None:
+    def save_html_cache(self, division: Dict[str, Any], html_content: str,
+                        validators: Optional[Dict[str, str]] = None) -> None:
         """
         Save HTML content and metadata to cache.
         
@@ -231,6 +431,9 @@ class GVSAScraper:
             Division dictionary
         html_content : str
             HTML content to cache
+        validators : Optional[Dict[str, str]]
+            Response validators ('last_modified', 'etag') to store in the
+            metadata for later conditional requests (optional)
         """
         if not self.use_cache:
             return
@@ -238,11 +441,19 @@ class GVSAScraper:
         html_path, json_path, csv_path = self.get_cache_path(division)
         
         try:
-            # Save HTML - no lock needed, each thread writes to different files
-            html_path.write_text(html_content, encoding='utf-8')
+            # Save HTML (atomic replace, so concurrent readers never see a partial file).
+            # Compressed and plain copies are exclusive; drop the stale other form.
+            gz_path = html_path.with_name(html_path.name + '.gz')
+            if self.compress_cache:
+                # Level 1: nearly all of the size win on this markup for a fraction of the CPU
+                self._atomic_write_bytes(gz_path, gzip.compress(html_content.encode('utf-8'), compresslevel=1))
+                html_path.unlink(missing_ok=True)
+            else:
+                self._atomic_write_text(html_path, html_content)
+                gz_path.unlink(missing_ok=True)
             
             # Save metadata (division info) - use helper method
-            self._save_metadata_json(json_path, division)
+            self._save_metadata_json(json_path, division, validators)
             
             # Note: CSV is cached separately by save_csv_cache()
         except Exception as e:
@@ -267,14 +478,13 @@ class GVSAScraper:
         
         _, _, csv_path = self.get_cache_path(division)
         
-        with self.cache_lock:
-            if csv_path.exists():
-                try:
-                    content = csv_path.read_text(encoding='utf-8')
-                    return content
-                except Exception as e:
-                    print(f"  - Error reading CSV cache: {e}")
-                    return None
+        if csv_path.exists():
+            try:
+                content = csv_path.read_text(encoding='utf-8')
+                return content
+            except Exception as e:
+                print(f"  - Error reading CSV cache: {e}")
+                return None
         
         return None
     
@@ -296,10 +506,60 @@ class GVSAScraper:
         
         try:
             # No lock needed, each thread writes to different files
-            csv_path.write_text(csv_content, encoding='utf-8')
+            self._atomic_write_text(csv_path, csv_content)
         except Exception as e:
             print(f"  - Error saving CSV cache: {e}")
     
+    def _post_listing(self, url: str, post_data: Dict[str, str]) -> str:
+        """
+        POST to a listing page (seasons.jsp), reusing a recent on-disk response.
+        
+        Responses are cached under html_cache/_listings/ keyed by a hash of the
+        URL and POST payload, so repeated scrapes skip the network round trip.
+        The .jsp suffix keeps them out of the *.html/*.csv standings scans.
+        
+        Parameters
+        ----------
+        url : str
+            Listing page URL
+        post_data : Dict[str, str]
+            Form data to POST
+            
+        Returns
+        -------
+        str
+            Response HTML
+            
+        Raises
+        ------
+        requests.RequestException
+            If the request fails
+        """
+        cache_file: Optional[Path] = None
+        if self.use_cache:
+            key = blake2b(repr((url, sorted(post_data.items()))).encode('utf-8'), digest_size=16).hexdigest()
+            cache_file = self.CACHE_DIR / '_listings' / f"{key}.jsp"
+            try:
+                if time.time() - cache_file.stat().st_mtime < self.LISTING_CACHE_TTL:
+                    return cache_file.read_text(encoding='utf-8')
+            except OSError:
+                pass
+        
+        # Listing requests share the workers' rate limit (they run alongside division fetches)
+        self._wait_for_request_slot()
+        response = self.session.post(url, data=post_data)
+        response.raise_for_status()
+        response.encoding = 'ISO-8859-1'
+        html_content = response.text
+        
+        if cache_file is not None:
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                self._atomic_write_text(cache_file, html_content)
+            except OSError as e:
+                print(f"  - Error saving listing cache: {e}")
+        return html_content
+    
     def get_seasons(self) -> List[Dict[str, str]]:
         """
         Fetch and parse all available seasons.
@@ -313,11 +573,9 @@ class GVSAScraper:
         print(f"Fetching seasons from {url}...")
         
         try:
-            response = self.session.post(url, data={'seasons.x': '64', 'seasons.y': '13'})
-            response.raise_for_status()
-            response.encoding = 'ISO-8859-1'
+            html_content = self._post_listing(url, {'seasons.x': '64', 'seasons.y': '13'})
             
-            seasons = parse_seasons_list(response.text)
+            seasons = parse_seasons_list(html_content)
             print(f"Found {len(seasons)} seasons")
             return seasons
         except requests.RequestException as e:
@@ -348,11 +606,9 @@ class GVSAScraper:
                 # Use the stored season value directly
                 post_data['season'] = season['season_value']
             
-            response = self.session.post(url, data=post_data)
-            response.raise_for_status()
-            response.encoding = 'ISO-8859-1'
+            html_content = self._post_listing(url, post_data)
             
-            divisions = parse_divisions(response.text)
+            divisions = parse_divisions(html_content)
             if season:
                 print(f"Found {len(divisions)} divisions for {season['season_name']}")
             else:
@@ -384,77 +640,69 @@ class GVSAScraper:
         """
         url = f"{self.BASE_URL}/standings.jsp"
         
-        # Build division parameter with exact spacing/padding as seen in mitm logs
-        # Format: "      2843,2025/2026 ,      2775,      2846,Fall 2025                     ,U17/18/19 Girls Elite         ,F"
-        # IDs: 10 chars (7 spaces + 3-4 digits), Names: 30 chars, Year: 10 chars (with trailing space)
-        division_param = (
-            f"{str(division['division_id']):>10},"
-            f"{division['year_season']} ,"
-            f"{str(division['season_id1']):>10},"
-            f"{str(division['season_id2']):>10},"
-            f"{division['season_name']:<30},"
-            f"{division['division_name']:<30},"
-            f"{division['season_type']}"
-        )
+        division_param = self._build_division_param(division)
         
-        # Try CSV download first if requested
-        if use_csv:
-            session = requests.Session()
-            session.headers.update(self.session.headers)
+        # Try CSV download first if requested, unless this season has shown it has no CSV export
+        season_key = str(division.get('season_id1', ''))
+        if use_csv and self._csv_available.get(season_key) is not False:
             try:
-                csv_content = download_csv_standings(url, division_param, session)
+                csv_content = download_csv_standings(url, division_param, self.session,
+                                                     wait_for_slot=self._wait_for_request_slot)
                 if csv_content:
                     # Successfully got CSV data
                     standings_data = parse_csv_standings(csv_content)
                     standings_data['division'] = division
-                    session.close()
+                    with self._csv_lock:
+                        self._csv_available[season_key] = True
                     return standings_data
             except Exception as e:
                 # CSV download failed, fall back to HTML
                 pass
-            finally:
-                session.close()
-        
-        html_content: Optional[str] = None
-        
-        # Try to get from cache first
-        if not force_refresh:
-            html_content = self.get_cached_html(division)
-            if html_content:
-                # Using cache - no delay needed
-                pass
+            with self._csv_lock:
+                if season_key not in self._csv_available:
+                    failures = self._csv_failures.get(season_key, 0) + 1
+                    self._csv_failures[season_key] = failures
+                    if failures >= self.CSV_PROBE_LIMIT:
+                        self._csv_available[season_key] = False
+        
+        cached_html: Optional[bytes] = None
+        root = None
+        
+        # Try to get from cache first (as UTF-8 bytes, handed to lxml without decoding)
+        if not force_refresh and self.use_cache:
+            try:
+                cached_html = self.read_html_cache_bytes(self.get_cache_path(division)[0])
+            except Exception as e:
+                print(f"  - Error reading cache: {e}")
         
         # Fetch from web if not cached
-        if html_content is None:
-            # Create a new session for thread safety
-            session = requests.Session()
-            session.headers.update(self.session.headers)
-            
+        if cached_html is None:
             try:
-                response = session.post(url, data={'division': division_param}, timeout=30)
-                response.raise_for_status()
-                response.encoding = 'ISO-8859-1'
-                html_content = response.text
+                # Be polite to the server (only for network requests)
+                self._wait_for_request_slot()
+                # Stream the body into lxml while it downloads
+                with self.session.post(url, data={'division': division_param}, timeout=30, stream=True) as response:
+                    response.raise_for_status()
+                    root, body = parse_html_chunks(response.iter_content(chunk_size=65536), PAGE_ENCODING)
+                html_content = body.decode(PAGE_ENCODING)
                 
                 # Save to cache
                 self.save_html_cache(division, html_content)
-                
-                # Small delay to be polite to the server (only for network requests)
-                time.sleep(self.delay)
             except requests.RequestException as e:
                 display_name = division.get('display_name', division.get('division_name', 'unknown'))
                 print(f"Error fetching standings for {display_name}: {e}")
                 return None
-            finally:
-                session.close()
         
-        # Parse the HTML (from cache or fresh)
-        standings_data = parse_standings(html_content)
+        # Parse the HTML (fresh pages were already parsed while streaming)
+        if root is not None:
+            standings_data = parse_standings_from_tree(root)
+        else:
+            standings_data = parse_standings(cached_html, encoding='utf-8')
         standings_data['division'] = division
         
         return standings_data
     
-    def _process_division(self, division: Dict[str, Any], div_idx: int, total: int, db: Optional[GVSA_Database] = None) -> Optional[Dict[str, Any]]:
+    def _process_division(self, division: Dict[str, Any], div_idx: int, total: int) -> Optional[Dict[str, Any]]:
         """
         Process a single division (used by parallel processing).
         
@@ -466,8 +714,6 @@ class GVSAScraper:
             Division index (for display)
         total : int
             Total number of divisions (for display)
-        db : Optional[GVSA_Database]
-            Database instance to save data to (optional)
             
         Returns
         -------
@@ -478,9 +724,6 @@ class GVSAScraper:
         standings = self.get_standings(division, force_refresh=False)
         
         if standings:
-            # Save to database immediately in this thread (PonyORM handles thread safety)
-            if db:
-                db.save_standings(standings)
             print(f"[{div_idx}/{total}] ✓ {display_name}: {len(standings['teams'])} teams, {len(standings['matches'])} matches")
         else:
             print(f"[{div_idx}/{total}] ✗ {display_name}: Failed to fetch")
@@ -514,64 +757,68 @@ class GVSAScraper:
         total_divisions = 0
         total_cached = 0
         
-        # Fetch each season
-        for season_idx, season in enumerate(seasons, 1):
-            if season:
-                print(f"\n{'='*80}")
-                print(f"Season {season_idx}/{len(seasons)}: {season['season_name']}")
-                print(f"{'='*80}")
-            
-            # Get divisions for this season
-            divisions = self.get_divisions(season)
-            if not divisions:
-                print("No divisions found for this season, skipping...")
-                continue
-            
-            total_divisions += len(divisions)
-            
-            # Check how many are already cached (both HTML and CSV)
-            cached_count = sum(1 for div in divisions 
-                             if self.get_cached_html(div) and self.get_cached_csv(div))
-            total_cached += cached_count
-            
-            if cached_count == len(divisions):
-                print(f"\n✓ All {len(divisions)} divisions already cached (HTML + CSV), skipping...")
-                continue
-            
-            # Fetch HTML and CSV in parallel (but don't parse)
-            remaining = len(divisions) - cached_count
-            print(f"\nFetching HTML + CSV for {remaining} divisions ({(len(divisions) - cached_count)} new, {cached_count} already cached) with {self.max_workers} workers...")
-            
-            completed_count = 0
-            
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+        # One pool for the whole crawl: divisions from the next season are queued
+        # while the current season's slowest fetches are still in flight, instead
+        # of waiting for every season to drain before listing the next one
+        futures: Dict[Any, Tuple[int, int, Dict[str, Any]]] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # Fetch each season
+            for season_idx, season in enumerate(seasons, 1):
+                if season:
+                    print(f"\n{'='*80}")
+                    print(f"Season {season_idx}/{len(seasons)}: {season['season_name']}")
+                    print(f"{'='*80}")
+                
+                # Get divisions for this season
+                divisions = self.get_divisions(season)
+                if not divisions:
+                    print("No divisions found for this season, skipping...")
+                    continue
+                
+                total_divisions += len(divisions)
+                
+                # Check how many are already cached (both HTML and CSV); the
+                # directory listings are reused so workers don't stat each file again
+                dir_names: Dict[Path, Set[str]] = {}
+                cached_count = self._count_cached(divisions, dir_names)
+                total_cached += cached_count
+                
+                if cached_count == len(divisions):
+                    print(f"\n✓ All {len(divisions)} divisions already cached (HTML + CSV), skipping...")
+                    continue
+                
+                # Fetch HTML and CSV in parallel (but don't parse)
+                remaining = len(divisions) - cached_count
+                print(f"\nQueueing HTML + CSV fetches for {remaining} divisions ({(len(divisions) - cached_count)} new, {cached_count} already cached) with {self.max_workers} workers...")
+                
                 # Submit all tasks
-                futures = {
-                    executor.submit(
+                for div_idx, division in enumerate(divisions):
+                    future = executor.submit(
                         self._fetch_html_only,
                         division,
                         div_idx + 1,
-                        len(divisions)
-                    ): (div_idx, division)
-                    for div_idx, division in enumerate(divisions)
-                }
+                        len(divisions),
+                        dir_names.get(self.get_cache_path(division)[0].parent)
+                    )
+                    futures[future] = (div_idx, len(divisions), division)
+            
+            # Collect results as they complete
+            completed_count = 0
+            for future in as_completed(futures):
+                div_idx, season_total, division = futures[future]
+                completed_count += 1
+                try:
+                    fetched = future.result()
+                    if fetched:
+                        total_fetched += 1
+                except Exception as e:
+                    display_name = division.get('display_name', division.get('division_name', 'unknown'))
+                    print(f"[{div_idx}/{season_total}] ✗ {display_name}: Error - {e}")
+                    traceback.print_exc()
                 
-                # Collect results as they complete
-                for future in as_completed(futures):
-                    div_idx, division = futures[future]
-                    completed_count += 1
-                    try:
-                        fetched = future.result()
-                        if fetched:
-                            total_fetched += 1
-                    except Exception as e:
-                        display_name = division.get('display_name', division.get('division_name', 'unknown'))
-                        print(f"[{div_idx}/{len(divisions)}] ✗ {display_name}: Error - {e}")
-                        traceback.print_exc()
-                    
-                    # Periodic progress update (every 25 divisions or at completion)
-                    if completed_count % 25 == 0 or completed_count == len(divisions):
-                        print(f"Progress: {completed_count}/{len(divisions)} divisions processed")
+                # Periodic progress update (every 25 divisions or at completion)
+                if completed_count % 25 == 0 or completed_count == len(futures):
+                    print(f"Progress: {completed_count}/{len(futures)} divisions processed")
         
         print(f"\n{'='*80}")
         print("HTML Fetching Summary:")
@@ -582,7 +829,92 @@ class GVSAScraper:
         
         return total_fetched
     
-    def _fetch_html_only(self, division: Dict[str, Any], div_idx: int, total: int) -> bool:
+    def _is_cached(self, division: Dict[str, Any], names: Optional[Set[str]] = None) -> bool:
+        """
+        Check whether a division's HTML (plain or compressed) and CSV are both cached.
+        
+        Only looks for the files; nothing is read.
+        
+        Parameters
+        ----------
+        division : Dict[str, Any]
+            Division dictionary
+        names : Optional[Set[str]]
+            File names in the division's cache directory, from a previous scan
+            (optional; the files are checked individually otherwise)
+            
+        Returns
+        -------
+        bool
+            True if both the HTML and the CSV are cached
+        """
+        if not self.use_cache:
+            return False
+        html_path, _, csv_path = self.get_cache_path(division)
+        if names is None:
+            return ((html_path.exists() or html_path.with_name(html_path.name + '.gz').exists())
+                    and csv_path.exists())
+        return self._has_cached_html(division, names) and csv_path.name in names
+    
+    def _has_cached_html(self, division: Dict[str, Any], names: Set[str]) -> bool:
+        """
+        Check a directory listing for a division's HTML cache file (plain or compressed).
+        
+        Parameters
+        ----------
+        division : Dict[str, Any]
+            Division dictionary
+        names : Set[str]
+            File names in the division's cache directory
+            
+        Returns
+        -------
+        bool
+            True if the HTML is cached
+        """
+        html_name = self.get_cache_path(division)[0].name
+        return html_name in names or html_name + '.gz' in names
+    
+    def _count_cached(self, divisions: List[Dict[str, Any]],
+                      dir_names: Optional[Dict[Path, Set[str]]] = None) -> int:
+        """
+        Count divisions whose HTML and CSV are both cached.
+        
+        Lists each cache directory once with os.scandir instead of checking
+        (or reading) every division's files separately.
+        
+        Parameters
+        ----------
+        divisions : List[Dict[str, Any]]
+            Division dictionaries
+        dir_names : Optional[Dict[Path, Set[str]]]
+            Filled with the file names found in each cache directory, so
+            callers can reuse the listing (optional)
+            
+        Returns
+        -------
+        int
+            Number of fully cached divisions
+        """
+        if dir_names is None:
+            dir_names = {}
+        cached = 0
+        for division in divisions:
+            cache_dir = self.get_cache_path(division)[0].parent
+            names = dir_names.get(cache_dir)
+            if names is None:
+                try:
+                    with os.scandir(cache_dir) as entries:
+                        names = {entry.name for entry in entries}
+                except FileNotFoundError:
+                    names = set()
+                dir_names[cache_dir] = names
+            if self._is_cached(division, names):
+                cached += 1
+        return cached
+    
+    def _fetch_html_only(self, division: Dict[str, Any], div_idx: int, total: int,
+                         names: Optional[Set[str]] = None) -> bool:
         """
         Fetch and save HTML for a single division without parsing.
         
@@ -594,6 +926,9 @@ class GVSAScraper:
             Division index (for display)
         total : int
             Total number of divisions (for display)
+        names : Optional[Set[str]]
+            File names in the division's cache directory, from a previous scan
+            (optional; the files are checked individually otherwise)
             
         Returns
         -------
@@ -603,56 +938,63 @@ class GVSAScraper:
         display_name = division.get('display_name', division.get('division_name', 'unknown'))
         
         # Check if already cached (both HTML and CSV)
-        html_cached = self.get_cached_html(division)
-        csv_cached = self.get_cached_csv(division)
-        if html_cached and csv_cached:
+        if self._is_cached(division, names):
             print(f"[{div_idx}/{total}] ⊘ {display_name}: Already cached (HTML + CSV)")
             return False
+        html_cached = None
+        if names is None or self._has_cached_html(division, names):
+            html_cached = self.get_cached_html(division)
         
         # Fetch from web
         url = f"{self.BASE_URL}/standings.jsp"
-        # Build division parameter with exact spacing/padding as seen in mitm logs
-        # Format: "      2843,2025/2026 ,      2775,      2846,Fall 2025                     ,U17/18/19 Girls Elite         ,F"
-        # IDs: 10 chars (7 spaces + 3-4 digits), Names: 30 chars, Year: 10 chars (with trailing space)
-        division_param = (
-            f"{str(division['division_id']):>10},"
-            f"{division['year_season']} ,"
-            f"{str(division['season_id1']):>10},"
-            f"{str(division['season_id2']):>10},"
-            f"{division['season_name']:<30},"
-            f"{division['division_name']:<30},"
-            f"{division['season_type']}"
-        )
+        division_param = self._build_division_param(division)
         
-        # Create a new session for thread safety
-        session = requests.Session()
-        session.headers.update(self.session.headers)
+        # Only the CSV is missing: revalidate the cached page instead of downloading it again
+        request_headers: Dict[str, str] = {}
+        if html_cached:
+            metadata = self.get_cached_metadata(division) or {}
+            if metadata.get('etag'):
+                request_headers['If-None-Match'] = metadata['etag']
+            if metadata.get('last_modified'):
+                request_headers['If-Modified-Since'] = metadata['last_modified']
         
         try:
-            # Use single timeout value
-            response = session.post(url, data={'division': division_param}, timeout=30)
+            # Use single timeout value; the shared session reuses pooled keep-alive connections
+            self._wait_for_request_slot()  # Be polite to the server
+            response = self.session.post(url, data={'division': division_param},
+                                         headers=request_headers or None, timeout=30)
             response.raise_for_status()
-            response.encoding = 'ISO-8859-1'
-            html_content = response.text
             
-            # Save to cache
-            # Debug breakpoint - can be enabled with: PYTHONBREAKPOINT=pdb.set_trace
-            if os.getenv('GVSA_DEBUG_SAVE'):
-                pdb.set_trace()
-            self.save_html_cache(division, html_content)
+            page: Union[str, bytes]
+            if response.status_code == 304:
+                # Cached page is still current - keep it and only fetch the CSV
+                page = html_cached
+            else:
+                # Parse the raw bytes below; lxml decodes them without another str copy
+                page = response.content
+                html_content = page.decode(PAGE_ENCODING)
+                
+                # Save to cache
+                # Debug breakpoint - can be enabled with: PYTHONBREAKPOINT=pdb.set_trace
+                if os.getenv('GVSA_DEBUG_SAVE'):
+                    pdb.set_trace()
+                self.save_html_cache(division, html_content, {
+                    'last_modified': response.headers.get('Last-Modified'),
+                    'etag': response.headers.get('ETag')
+                })
             
             # Extract CSV link from HTML and download/cache CSV (optional, non-blocking)
             csv_link = None
             try:
-                csv_link = parse_csv_link(html_content)
+                csv_link = parse_csv_link(page)
             except Exception:
-                # BeautifulSoup parsing failed - skip CSV for this division
+                # HTML parsing failed - skip CSV for this division
                 pass
             
             if csv_link:
                 try:
                     # Download CSV with shorter timeout (10s) to avoid blocking
-                    csv_response = session.get(csv_link, timeout=10)
+                    csv_response = self.session.get(csv_link, timeout=10)
                     csv_response.raise_for_status()
                     csv_content = csv_response.text
                     
@@ -665,7 +1007,6 @@ class GVSAScraper:
             else:
                 print(f"[{div_idx}/{total}] ✓ {display_name}: Fetched and cached (HTML, no CSV link)")
             
-            time.sleep(self.delay)  # Be polite to the server
             return True
         except requests.Timeout as e:
             print(f"[{div_idx}/{total}] ✗ {display_name}: Request timeout - {e}")
@@ -678,8 +1019,6 @@ class GVSAScraper:
             if __debug__:
                 import pdb; pdb.post_mortem()
             return False
-        finally:
-            session.close()
     
     def parse_cached_html(self, db: Optional[GVSA_Database] = None) -> List[Dict[str, Any]]:
         """
@@ -704,7 +1043,7 @@ class GVSAScraper:
         all_standings: List[Dict[str, Any]] = []
         
         # Walk through cache directory structure: html_cache/{year}_{season_type}/*.html
-        cache_files = list(self.CACHE_DIR.rglob("*.html"))
+        cache_files = self._scan_cache_files()
         
         if not cache_files:
             print("No cached HTML files found. Run fetch_html_only() first.")
@@ -713,38 +1052,187 @@ class GVSAScraper:
         print(f"\n{'='*80}")
         print(f"Found {len(cache_files)} cached HTML files")
         print(f"{'='*80}")
-        print(f"\nParsing cached HTML files with {self.max_workers} workers...")
-        
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all parsing tasks
-            futures = {
-                executor.submit(
-                    self._parse_cached_file,
-                    cache_file,
-                    idx + 1,
-                    len(cache_files),
-                    db
-                ): (idx, cache_file)
-                for idx, cache_file in enumerate(cache_files)
-            }
+        # HTML parsing is CPU-bound, so it runs in worker processes (threads would
+        # serialize on the GIL). Metadata lookups and database writes stay in this
+        # process: the scraper session and the database are not picklable.
+        num_workers = max(1, min(self.max_workers, os.cpu_count() or 1))
+        print(f"\nParsing cached HTML files with {num_workers} worker processes...")
+        
+        total = len(cache_files)
+        parsed = 0
+        # Parsed divisions waiting to be written in one transaction
+        pending: List[Dict[str, Any]] = []
+        # Progress lines for divisions on their way to the database, printed once committed
+        progress: Dict[int, str] = {}
+        
+        def report_saved(standings_data: Dict[str, Any]) -> None:
+            print(progress.pop(id(standings_data)))
+            all_standings.append(standings_data)
+        
+        save_failures: List[Tuple[Dict[str, Any], Exception]] = []
+        write_queue, writer = None, None
+        if db:
+            write_queue, writer, save_failures = self._start_db_writer(db, on_saved=report_saved)
+        try:
+            with ProcessPoolExecutor(max_workers=num_workers) as executor:
+                # Submit all parsing tasks
+                futures = {
+                    executor.submit(_parse_cached_html_file, cache_file): (idx + 1, cache_file)
+                    for idx, cache_file in enumerate(cache_files)
+                }
+                
+                # Collect results as they complete
+                for future in as_completed(futures):
+                    idx, cache_file = futures[future]
+                    try:
+                        standings_data = future.result()
+                        if standings_data is None:
+                            continue
+                        standings_data['division'] = self._load_cached_division_info(cache_file)
+                        parsed += 1
+                        
+                        line = f"[{idx}/{total}] ✓ {cache_file.name}: {len(standings_data['teams'])} teams, {len(standings_data['matches'])} matches"
+                        if write_queue is None:
+                            print(line)
+                            all_standings.append(standings_data)
+                            continue
+                        
+                        # Save to database in batches (one commit per DB_BATCH_SIZE divisions)
+                        progress[id(standings_data)] = line
+                        pending.append(standings_data)
+                        if len(pending) >= self.DB_BATCH_SIZE:
+                            write_queue.put(pending)
+                            pending = []
+                    except Exception as e:
+                        print(f"[{idx}/{total}] ✗ {cache_file.name}: Error - {e}")
             
-            # Collect results as they complete
-            for future in as_completed(futures):
-                idx, cache_file = futures[future]
-                try:
-                    standings = future.result()
-                    if standings:
-                        all_standings.append(standings)
-                except Exception as e:
-                    print(f"Error parsing {cache_file}: {e}")
+            if write_queue is not None and pending:
+                write_queue.put(pending)
+        finally:
+            if writer is not None:
+                write_queue.put(None)
+                writer.join()
         
         print(f"\n{'='*80}")
         print("Parsing Summary:")
         print(f"  Cached files processed: {len(cache_files)}")
-        print(f"  Successfully parsed: {len(all_standings)}")
+        print(f"  Successfully parsed: {parsed}")
+        if db:
+            print(f"  Saved to database: {len(all_standings)}")
+            print(f"  Failed to save: {len(save_failures)}")
         
         return all_standings
     
+    def _scan_cache_files(self) -> List[Path]:
+        """
+        List cached HTML files anywhere under CACHE_DIR.
+        
+        Uses os.scandir, whose directory entries carry the file type, so the
+        walk needs no per-file stat() calls. Compressed entries (*.html.gz) are
+        listed under their plain .html path, which _parse_cached_html_file
+        reads through read_html_cache_bytes.
+        
+        Returns
+        -------
+        List[Path]
+            Cached HTML file paths, each listed once
+        """
+        names: Dict[str, None] = {}
+        pending = [str(self.CACHE_DIR)]
+        while pending:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.name.endswith('.html'):
+                        names[entry.path] = None
+                    elif entry.name.endswith('.html.gz'):
+                        names[entry.path[:-3]] = None
+        return [Path(name) for name in names]
+    
+    def _start_db_writer(self, db: GVSA_Database,
+                         on_saved: Optional[Callable[[Dict[str, Any]], None]] = None
+                         ) -> Tuple["queue.Queue[Optional[List[Dict[str, Any]]]]", threading.Thread,
+                                    List[Tuple[Dict[str, Any], Exception]]]:
+        """
+        Start the database writer thread.
+        
+        Batches put on the returned queue are saved in order, one transaction
+        each, while the caller keeps fetching or parsing. Put None on the queue
+        and join the thread to finish; the failure list is complete once the
+        thread has been joined.
+        
+        Parameters
+        ----------
+        db : GVSA_Database
+            Database instance to save data to
+        on_saved : Optional[Callable[[Dict[str, Any]], None]]
+            Called on the writer thread with each division once its batch
+            has been committed (default: None)
+            
+        Returns
+        -------
+        Tuple[queue.Queue, threading.Thread, List[Tuple[Dict[str, Any], Exception]]]
+            Queue of standings batches, the running writer thread, and the
+            list it fills with the standings data and error of every division
+            that could not be saved
+        """
+        # Bounded, so producers wait rather than piling up parsed data if the writer falls behind
+        write_queue: "queue.Queue[Optional[List[Dict[str, Any]]]]" = queue.Queue(maxsize=4)
+        
+        failures: List[Tuple[Dict[str, Any], Exception]] = []
+        
+        def write_batches() -> None:
+            while True:
+                batch = write_queue.get()
+                if batch is None:
+                    return
+                batch_failures = self._save_batch(db, batch)
+                failures.extend(batch_failures)
+                if on_saved is not None:
+                    failed = {id(standings_data) for standings_data, _ in batch_failures}
+                    for standings_data in batch:
+                        if id(standings_data) in failed:
+                            continue
+                        # The thread must keep draining the bounded queue, or every
+                        # later put() (including the None sentinel) blocks forever
+                        try:
+                            on_saved(standings_data)
+                        except Exception as e:
+                            print(f"  - Error reporting saved division: {e}")
+        
+        writer = threading.Thread(target=write_batches, name='gvsa-db-writer', daemon=True)
+        writer.start()
+        return write_queue, writer, failures
+    
+    @staticmethod
+    def _save_batch(db: GVSA_Database, standings_list: List[Dict[str, Any]]) -> List[Tuple[Dict[str, Any], Exception]]:
+        """
+        Save a batch of parsed divisions in one transaction, reporting failures.
+        
+        Parameters
+        ----------
+        db : GVSA_Database
+            Database instance to save data to
+        standings_list : List[Dict[str, Any]]
+            Standings data dictionaries to save
+            
+        Returns
+        -------
+        List[Tuple[Dict[str, Any], Exception]]
+            Standings data and error for each division that was not saved
+        """
+        try:
+            failed = db.save_standings_batch(standings_list)
+        except Exception as e:
+            print(f"  - Error saving batch of {len(standings_list)} divisions: {e}")
+            return [(standings_data, e) for standings_data in standings_list]
+        for standings_data, e in failed:
+            division_info = standings_data.get('division', {})
+            display_name = division_info.get('display_name', division_info.get('division_name', 'unknown'))
+            print(f"  - Failed to save {display_name}: {e}")
+        return failed
+    
     def _reconstruct_division_info_from_path(self, cache_file: Path) -> Dict[str, Any]:
         """
         Reconstruct division information from cache file path.
@@ -848,7 +1336,7 @@ class GVSAScraper:
                             # Update division_name to match dropdown (authoritative source)
                             division_info['division_name'] = div.get('division_name', division_name)
                             division_info['season_name'] = div.get('season_name', season_name)
-                            division_info['season_type'] = 'Fall' if div.get('season_type', 'F') == 'F' else 'Spring'
+                            division_info['season_type'] = _SEASON_TYPE_NAMES.get(div.get('season_type', 'F'), 'Spring')
                             return division_info
                 
                 # Try fuzzy matching if exact match failed
@@ -881,7 +1369,7 @@ class GVSAScraper:
                                         division_info['year_season'] = div.get('year_season', '')
                                         division_info['division_name'] = div.get('division_name', division_name)
                                         division_info['season_name'] = div.get('season_name', season_name)
-                                        division_info['season_type'] = 'Fall' if div.get('season_type', 'F') == 'F' else 'Spring'
+                                        division_info['season_type'] = _SEASON_TYPE_NAMES.get(div.get('season_type', 'F'), 'Spring')
                                         return division_info
         except Exception:
             # If lookup fails, fall back to using division_name
@@ -892,7 +1380,8 @@ class GVSAScraper:
         division_info['division_id'] = division_name
         return division_info
     
-    def _save_metadata_json(self, metadata_path: Path, division_info: Dict[str, Any]) -> None:
+    def _save_metadata_json(self, metadata_path: Path, division_info: Dict[str, Any],
+                            validators: Optional[Dict[str, str]] = None) -> None:
         """
         Save metadata JSON file with division information.
         
@@ -902,19 +1391,21 @@ class GVSAScraper:
             Path to metadata JSON file
         division_info : Dict[str, Any]
             Division info dictionary
+        validators : Optional[Dict[str, str]]
+            Response validators ('last_modified', 'etag'); when omitted, any
+            validators already present in division_info are kept
         """
         # Extract year from season_name (e.g., "Spring 2019" -> "2019")
         season_name = division_info.get('season_name', '')
         year = 'unknown'
         if season_name:
-            year_match = re.search(r'\b(20\d{2})\b', season_name)
+            year_match = _SEASON_YEAR_RE.search(season_name)
             if year_match:
                 year = year_match.group(1)
         
         # Normalize season_type
         season_type = division_info.get('season_type', 'Fall')
-        if season_type in ('F', 'S'):
-            season_type = 'Fall' if season_type == 'F' else 'Spring'
+        season_type = _SEASON_TYPE_NAMES.get(season_type, season_type)
         
         metadata = {
             'division_id': division_info.get('division_id', ''),
@@ -926,78 +1417,74 @@ class GVSAScraper:
             'season_type': season_type
         }
         
-        # No lock needed - each thread writes to different files
-        metadata_path.write_text(json.dumps(metadata, indent=2), encoding='utf-8')
+        # Cache validators for conditional re-fetches
+        if validators is None:
+            validators = division_info
+        for key in ('last_modified', 'etag'):
+            if validators.get(key):
+                metadata[key] = validators[key]
+        
+        # Re-fetched pages usually carry unchanged metadata; skip the temp file + rename then
+        content = _dumps_metadata(metadata)
+        try:
+            if metadata_path.read_bytes() == content.encode('utf-8'):
+                return
+        except FileNotFoundError:
+            pass
+        self._atomic_write_text(metadata_path, content)
     
-    def _parse_cached_file(self, cache_file: Path, idx: int, total: int, db: Optional[GVSA_Database] = None) -> Optional[Dict[str, Any]]:
+    def _load_cached_division_info(self, cache_file: Path) -> Dict[str, Any]:
         """
-        Parse a single cached HTML file.
+        Load division information for a cached HTML file.
+        
+        Reads the metadata JSON stored alongside the HTML. When it is missing or
+        incomplete, the division info is reconstructed from the path, the
+        division_id is looked up from the dropdown and the metadata is rewritten.
         
         Parameters
         ----------
         cache_file : Path
             Path to cached HTML file
-        idx : int
-            File index (for display)
-        total : int
-            Total number of files (for display)
-        db : Optional[GVSA_Database]
-            Database instance to save data to (optional)
             
         Returns
         -------
-        Optional[Dict[str, Any]]
-            Parsed standings data or None if parsing fails
+        Dict[str, Any]
+            Division info dictionary with division_id set
         """
-        try:
-            # Read cached HTML
-            html_content = cache_file.read_text(encoding='utf-8')
-            
-            # Read metadata JSON (should exist alongside HTML)
-            metadata_path = cache_file.with_suffix('.json')
-            division_info: Dict[str, Any] = {}
-            
-            if metadata_path.exists():
-                try:
-                    metadata_content = metadata_path.read_text(encoding='utf-8')
-                    division_info = json.loads(metadata_content)
-                    # Handle old metadata format with year_season
-                    if 'year_season' in division_info and 'year' not in division_info:
-                        year_season = division_info.get('year_season', '')
-                        if '/' in year_season:
-                            division_info['year'] = year_season.split('/')[0]
-                        else:
-                            division_info['year'] = year_season
-                    # Normalize season_type if it's "F" or "S"
-                    if division_info.get('season_type') == 'F':
-                        division_info['season_type'] = 'Fall'
-                    elif division_info.get('season_type') == 'S':
-                        division_info['season_type'] = 'Spring'
-                    # Remove display_name if present (redundant with division_name)
-                    if 'display_name' in division_info:
-                        del division_info['display_name']
-                    
-                    # Validate division_id is present and not empty
-                    division_id = division_info.get('division_id', '').strip()
-                    if not division_id:
-                        # division_id is missing or empty - need to look it up from dropdown
-                        division_info = self._lookup_division_id(division_info)
-                        
-                        # Save the updated metadata (lookup will always set division_id now)
-                        if division_info.get('division_id', '').strip():
-                            self._save_metadata_json(metadata_path, division_info)
-                except Exception as e:
-                    print(f"  - Warning: Could not read metadata for {cache_file.name}: {e}")
-                    # Fall back to reconstructing from path
-                    division_info = self._reconstruct_division_info_from_path(cache_file)
-                    # Try to look up division_id from dropdown (will fallback to division_name)
+        # Read metadata JSON (should exist alongside HTML)
+        metadata_path = cache_file.with_suffix('.json')
+        division_info: Dict[str, Any] = {}
+        
+        if metadata_path.exists():
+            try:
+                division_info = _loads_metadata(metadata_path.read_bytes())
+                # Handle old metadata format with year_season
+                if 'year_season' in division_info and 'year' not in division_info:
+                    year_season = division_info.get('year_season', '')
+                    if '/' in year_season:
+                        division_info['year'] = year_season.split('/')[0]
+                    else:
+                        division_info['year'] = year_season
+                # Normalize season_type if it's "F" or "S"
+                season_type = division_info.get('season_type')
+                if season_type in _SEASON_TYPE_NAMES:
+                    division_info['season_type'] = _SEASON_TYPE_NAMES[season_type]
+                # Remove display_name if present (redundant with division_name)
+                if 'display_name' in division_info:
+                    del division_info['display_name']
+                
+                # Validate division_id is present and not empty
+                division_id = division_info.get('division_id', '').strip()
+                if not division_id:
+                    # division_id is missing or empty - need to look it up from dropdown
                     division_info = self._lookup_division_id(division_info)
                     
-                    # Save the metadata JSON file (lookup will always set division_id)
+                    # Save the updated metadata (lookup will always set division_id now)
                     if division_info.get('division_id', '').strip():
                         self._save_metadata_json(metadata_path, division_info)
-            else:
-                # No metadata file - reconstruct from path
+            except Exception as e:
+                print(f"  - Warning: Could not read metadata for {cache_file.name}: {e}")
+                # Fall back to reconstructing from path
                 division_info = self._reconstruct_division_info_from_path(cache_file)
                 # Try to look up division_id from dropdown (will fallback to division_name)
                 division_info = self._lookup_division_id(division_info)
@@ -1005,27 +1492,22 @@ class GVSAScraper:
                 # Save the metadata JSON file (lookup will always set division_id)
                 if division_info.get('division_id', '').strip():
                     self._save_metadata_json(metadata_path, division_info)
+        else:
+            # No metadata file - reconstruct from path
+            division_info = self._reconstruct_division_info_from_path(cache_file)
+            # Try to look up division_id from dropdown (will fallback to division_name)
+            division_info = self._lookup_division_id(division_info)
             
-            # division_id should always be set now (either from lookup or fallback to division_name)
-            division_id = division_info.get('division_id', '').strip()
-            if not division_id:
-                # This should never happen now, but keep as safety check
-                division_info['division_id'] = division_info.get('division_name', 'unknown')
-                division_id = division_info['division_id']
-            
-            # Parse HTML
-            standings_data = parse_standings(html_content)
-            standings_data['division'] = division_info
-            
-            # Save to database
-            if db:
-                db.save_standings(standings_data)
-            
-            print(f"[{idx}/{total}] ✓ {cache_file.name}: {len(standings_data['teams'])} teams, {len(standings_data['matches'])} matches")
-            return standings_data
-        except Exception as e:
-            print(f"[{idx}/{total}] ✗ {cache_file.name}: Error - {e}")
-            return None
+            # Save the metadata JSON file (lookup will always set division_id)
+            if division_info.get('division_id', '').strip():
+                self._save_metadata_json(metadata_path, division_info)
+        
+        # division_id should always be set now (either from lookup or fallback to division_name)
+        if not division_info.get('division_id', '').strip():
+            # This should never happen now, but keep as safety check
+            division_info['division_id'] = division_info.get('division_name', 'unknown')
+        
+        return division_info
     
     def scrape_all(self, db: Optional[GVSA_Database] = None) -> List[Dict[str, Any]]:
         """
@@ -1055,58 +1537,113 @@ class GVSAScraper:
         
         all_standings: List[Dict[str, Any]] = []
         total_divisions = 0
-        
-        # Scrape each season
-        for season_idx, season in enumerate(seasons, 1):
-            if season:
-                print(f"\n{'='*80}")
-                print(f"Season {season_idx}/{len(seasons)}: {season['season_name']}")
-                print(f"{'='*80}")
-            
-            # Get divisions for this season
-            divisions = self.get_divisions(season)
-            if not divisions:
-                print("No divisions found for this season, skipping...")
-                continue
-            
-            total_divisions += len(divisions)
-            
-            # Process divisions in parallel
-            print(f"\nProcessing {len(divisions)} divisions with {self.max_workers} workers...")
-            
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                # Submit all tasks
-                futures = {
-                    executor.submit(
-                        self._process_division,
-                        division,
-                        div_idx + 1,
-                        len(divisions),
-                        db
-                    ): (div_idx, division)
-                    for div_idx, division in enumerate(divisions)
-                }
+        scraped = 0
+        # Scraped divisions waiting to be written in one transaction
+        pending: List[Dict[str, Any]] = []
+        
+        # A single writer thread owns all database writes; with a database,
+        # only divisions whose batch committed are returned
+        save_failures: List[Tuple[Dict[str, Any], Exception]] = []
+        write_queue, writer = None, None
+        if db:
+            write_queue, writer, save_failures = self._start_db_writer(db, on_saved=all_standings.append)
+        try:
+            # Scrape each season
+            for season_idx, season in enumerate(seasons, 1):
+                if season:
+                    print(f"\n{'='*80}")
+                    print(f"Season {season_idx}/{len(seasons)}: {season['season_name']}")
+                    print(f"{'='*80}")
                 
-                # Collect results as they complete
-                for future in as_completed(futures):
-                    div_idx, division = futures[future]
-                    try:
-                        standings = future.result()
-                        if standings:
+                # Get divisions for this season
+                divisions = self.get_divisions(season)
+                if not divisions:
+                    print("No divisions found for this season, skipping...")
+                    continue
+                
+                total_divisions += len(divisions)
+                
+                # Process divisions in parallel
+                print(f"\nProcessing {len(divisions)} divisions with {self.max_workers} workers...")
+                
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    # Submit all tasks
+                    futures = {
+                        executor.submit(
+                            self._process_division,
+                            division,
+                            div_idx + 1,
+                            len(divisions)
+                        ): (div_idx, division)
+                        for div_idx, division in enumerate(divisions)
+                    }
+                    
+                    # Collect results as they complete
+                    for future in as_completed(futures):
+                        div_idx, division = futures[future]
+                        try:
+                            standings = future.result()
+                        except Exception as e:
+                            display_name = division.get('display_name', division.get('division_name', 'unknown'))
+                            print(f"Error processing {display_name}: {e}")
+                            continue
+                        if not standings:
+                            continue
+                        scraped += 1
+                        if write_queue is None:
                             all_standings.append(standings)
-                    except Exception as e:
-                        display_name = division.get('display_name', division.get('division_name', 'unknown'))
-                        print(f"Error processing {display_name}: {e}")
+                            continue
+                        
+                        # Save in batches on the writer thread (one commit per
+                        # DB_BATCH_SIZE divisions), overlapping writes with fetching
+                        pending.append(standings)
+                        if len(pending) >= self.DB_BATCH_SIZE:
+                            write_queue.put(pending)
+                            pending = []
+            
+            if write_queue is not None and pending:
+                write_queue.put(pending)
+        finally:
+            if writer is not None:
+                write_queue.put(None)
+                writer.join()
         
         print(f"\n{'='*80}")
         print("Scraping Summary:")
         print(f"  Seasons processed: {len(seasons)}")
         print(f"  Total divisions: {total_divisions}")
-        print(f"  Successfully scraped: {len(all_standings)}")
+        print(f"  Successfully scraped: {scraped}")
+        if db:
+            print(f"  Saved to database: {len(all_standings)}")
+            print(f"  Failed to save: {len(save_failures)}")
         
         return all_standings
 
 
+def _parse_cached_html_file(cache_file: Path) -> Optional[Dict[str, Any]]:
+    """
+    Read and parse a single cached HTML file.
+    
+    Module-level so it can be pickled for ProcessPoolExecutor workers; the
+    caller attaches division info and saves the result.
+    
+    Parameters
+    ----------
+    cache_file : Path
+        Path to cached HTML file (plain or with a .gz sibling)
+        
+    Returns
+    -------
+    Optional[Dict[str, Any]]
+        Parsed standings data (without 'division') or None if the file is missing
+    """
+    # Hand the UTF-8 bytes straight to lxml instead of decoding them to str first
+    html_content = GVSAScraper.read_html_cache_bytes(cache_file)
+    if html_content is None:
+        return None
+    return parse_standings(html_content, encoding='utf-8')
+
+
 def main() -> None:
     """
     Main entry point for the scraper.
@@ -5,15 +5,59 @@ Team matching candidates for manual review.
 This module provides functionality to generate candidate matches for teams,
 allowing manual review to learn correct parsing patterns.
 """
-from typing import List, Dict, Any, Optional
-from pony.orm import db_session, select
+from typing import List, Dict, Any, Optional, Set, NamedTuple, Tuple
+from pony.orm import db_session, select, count
 from .models import Team, TeamSeason, Division
 from .team_name_parser import parse_team_name, extract_base_identifier
 from .db_pony import TeamMatcher
 
+try:
+    from rapidfuzz import fuzz as rapid_fuzz, process as rapid_process
+    from rapidfuzz.utils import default_process
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
+
+
+class TeamIndex(NamedTuple):
+    """All teams, loaded once for candidate matching (see _build_team_index())."""
+    names: List[str]
+    choices: List[str]
+    teams_by_name: Dict[str, Team]
+    teams_by_base: Dict[Tuple[Optional[int], Optional[str], Optional[str]], List[Team]]
+    season_counts: Dict[int, int]
+
+
+def _build_team_index() -> TeamIndex:
+    """
+    Load every team once for candidate matching.
+    
+    Returns
+    -------
+    TeamIndex
+        Canonical names of all teams, the same names preprocessed for
+        rapidfuzz (lowercased, punctuation stripped; empty without rapidfuzz),
+        the first team for each canonical name, the teams grouped by
+        (birth_year, gender, base_club_name) and the number of seasons per
+        team id
+    """
+    all_teams = list(select(t for t in Team))
+    names = [t.canonical_name for t in all_teams]
+    teams_by_name: Dict[str, Team] = {}
+    teams_by_base: Dict[Tuple[Optional[int], Optional[str], Optional[str]], List[Team]] = {}
+    for t in all_teams:
+        teams_by_name.setdefault(t.canonical_name, t)
+        teams_by_base.setdefault((t.birth_year, t.gender, t.base_club_name), []).append(t)
+    # Preprocess the choices once instead of once per lookup
+    choices = [default_process(name) for name in names] if HAS_RAPIDFUZZ else []
+    # One GROUP BY instead of loading each candidate's seasons
+    season_counts = dict(select((t.id, count(t.seasons)) for t in Team))
+    return TeamIndex(names, choices, teams_by_name, teams_by_base, season_counts)
+
 
 @db_session
-def get_matching_candidates(team_name: str) -> Dict[str, Any]:
+def get_matching_candidates(team_name: str,
+                            team_index: Optional[TeamIndex] = None) -> Dict[str, Any]:
     """
     Get multiple candidate matches for a team name for manual review.
     
@@ -27,6 +71,9 @@ def get_matching_candidates(team_name: str) -> Dict[str, Any]:
     ----------
     team_name : str
         Team name to find candidates for
+    team_index : Optional[TeamIndex]
+        Team index from _build_team_index(), to share one load of the Team
+        table across many lookups (optional; loaded per call otherwise)
         
     Returns
     -------
@@ -40,12 +87,18 @@ def get_matching_candidates(team_name: str) -> Dict[str, Any]:
     # Parse the team name
     parsed = parse_team_name(team_name)
     
+    if team_index is None:
+        team_index = _build_team_index()
+    
     candidates: List[Dict[str, Any]] = []
+    # IDs of teams already in candidates (each team is listed once)
+    seen_ids: Set[int] = set()
     
     # Strategy 1: Exact canonical name match
     normalized = TeamMatcher.normalize_name(team_name)
-    exact_match = Team.get(canonical_name=normalized)
+    exact_match = team_index.teams_by_name.get(normalized)
     if exact_match:
+        seen_ids.add(exact_match.id)
         candidates.append({
             'team': exact_match,
             'match_type': 'exact_name',
@@ -60,10 +113,12 @@ def get_matching_candidates(team_name: str) -> Dict[str, Any]:
         club_name = parsed.get('club_name')
         
         if club_name:
-            matched = TeamMatcher.find_team_by_birth_year(
-                birth_year, gender, club_name, parsed.get('designation')
+            matched = TeamMatcher.pick_team_by_designation(
+                team_index.teams_by_base.get((birth_year, gender, TeamMatcher.normalize_name(club_name)), []),
+                parsed.get('designation')
             )
-            if matched and matched not in [c['team'] for c in candidates if 'team' in c]:
+            if matched and matched.id not in seen_ids:
+                seen_ids.add(matched.id)
                 confidence = 95
                 if parsed.get('designation') and matched.designation:
                     if matched.designation.upper() == parsed['designation'].upper():
@@ -80,15 +135,14 @@ def get_matching_candidates(team_name: str) -> Dict[str, Any]:
         base_id = extract_base_identifier(parsed)
         if base_id:
             # Find teams with matching base identifier
-            base_teams = list(select(
-                t for t in Team
-                if t.birth_year == parsed['birth_year']
-                and t.gender == parsed['gender']
-                and t.base_club_name == TeamMatcher.normalize_name(parsed.get('club_name', ''))
-            ))
+            base_club_name = TeamMatcher.normalize_name(parsed.get('club_name', ''))
+            base_teams = team_index.teams_by_base.get(
+                (parsed['birth_year'], parsed['gender'], base_club_name), []
+            )
             
             for team in base_teams:
-                if team not in [c['team'] for c in candidates if 'team' in c]:
+                if team.id not in seen_ids:
+                    seen_ids.add(team.id)
                     confidence = 85
                     if not parsed.get('designation') and not team.designation:
                         confidence = 90
@@ -100,20 +154,33 @@ def get_matching_candidates(team_name: str) -> Dict[str, Any]:
                     })
     
     # Strategy 4: Fuzzy string matching
-    all_teams = list(select(t for t in Team))
-    if all_teams:
-        from thefuzz import fuzz, process
-        matches = process.extract(
-            normalized,
-            [t.canonical_name for t in all_teams],
-            scorer=fuzz.ratio,
-            limit=5
-        )
+    if team_index.names:
+        if HAS_RAPIDFUZZ:
+            # Same scoring as thefuzz's process.extract with fuzz.ratio, on the
+            # preprocessed choices; 74.5 rounds up to the 75 threshold below
+            results = rapid_process.extract(
+                default_process(normalized),
+                team_index.choices,
+                scorer=rapid_fuzz.ratio,
+                limit=5,
+                score_cutoff=74.5
+            )
+            matches = [(team_index.names[idx], int(round(score))) for _, score, idx in results]
+        else:
+            from thefuzz import fuzz, process
+            matches = process.extract(
+                normalized,
+                team_index.names,
+                scorer=fuzz.ratio,
+                limit=5
+            )
         
-        for matched_name, score, _ in matches:
+        teams_by_name = team_index.teams_by_name
+        for matched_name, score, *_ in matches:
             if score >= 75:  # Lower threshold for candidates
-                matched_team = next((t for t in all_teams if t.canonical_name == matched_name), None)
-                if matched_team and matched_team not in [c['team'] for c in candidates if 'team' in c]:
+                matched_team = teams_by_name.get(matched_name)
+                if matched_team and matched_team.id not in seen_ids:
+                    seen_ids.add(matched_team.id)
                     candidates.append({
                         'team': matched_team,
                         'match_type': 'fuzzy',
@@ -154,7 +221,7 @@ def get_matching_candidates(team_name: str) -> Dict[str, Any]:
                 'match_type': c['match_type'],
                 'confidence': c['confidence'],
                 'reason': c['reason'],
-                'seasons_count': len(c['team'].seasons)
+                'seasons_count': team_index.season_counts.get(c['team'].id, 0)
             }
             for c in candidates
         ],
@@ -182,30 +249,30 @@ def get_teams_needing_review(limit: int = 50) -> List[Dict[str, Any]]:
     List[Dict[str, Any]]
         List of teams with candidate matches for review
     """
-    # Get all TeamSeason records
-    team_seasons = list(select(
-        ts for ts in TeamSeason
-    ).limit(limit * 10))  # Get more to filter
+    # Get TeamSeason names with their season/division in one joined query
+    team_seasons = select(
+        (ts.team_name, ts.division.season.season_name, ts.division.division_name)
+        for ts in TeamSeason
+    ).without_distinct().limit(limit * 10)  # Get more to filter
     
     # Group by unique team names
-    unique_names = {}
-    for ts in team_seasons:
-        name = ts.team_name
+    unique_names: Dict[str, Dict[str, Any]] = {}
+    for name, season_name, division_name in team_seasons:
         if name not in unique_names:
             unique_names[name] = {
                 'team_name': name,
-                'team_entity': ts.team,
                 'appearances': []
             }
         unique_names[name]['appearances'].append({
-            'season': ts.division.season.season_name,
-            'division': ts.division.division_name
+            'season': season_name,
+            'division': division_name
         })
     
-    # For each unique name, get candidates
+    # For each unique name, get candidates (loading the Team table once for all of them)
+    team_index = _build_team_index()
     review_list = []
     for name, data in list(unique_names.items())[:limit]:
-        candidates = get_matching_candidates(name)
+        candidates = get_matching_candidates(name, team_index)
         if len(candidates['candidates']) > 1 or candidates['recommended_match'] is None:
             review_list.append({
                 'team_name': name,
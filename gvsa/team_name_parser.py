@@ -8,9 +8,161 @@ This module provides comprehensive parsing of team names to extract:
 - Gender (Boys/Girls from "B"/"G")
 - Designation/color (e.g., "Red", "White", "Green", "Black", "Navy")
 """
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, NamedTuple, Union
+from functools import lru_cache
 import re
 
+# Precompiled patterns (compiled once at import, not looked up per call).
+# The four year patterns are fused into one alternation, listed in order of
+# precedence; each alternative is a named group (see _find_year_match()).
+_YEAR_PATTERNS_RE = re.compile(
+    r"(?P<apostrophe_year_gender>'(?P<year2_gender>\d{2})[BG]\b)"
+    r"|(?P<year_gender>(?P<year4_gender>\d{4})[BG]\b)"
+    r"|(?P<apostrophe_year>'(?P<year2>\d{2})\b)"
+    r"|(?P<year_only>\b(?P<year4>20[0-3]\d)\b)",
+    re.IGNORECASE
+)
+_YEAR_PATTERN_PRECEDENCE = ('apostrophe_year_gender', 'year_gender', 'apostrophe_year', 'year_only')
+# Two-digit year -> birth year: 00-30 are 2000-2030, 31-99 are 1931-1999
+_TWO_DIGIT_YEARS = tuple(2000 + year if year <= 30 else 1900 + year for year in range(100))
+# Gender letter (either case) -> gender
+_GENDER_NAMES = {'B': 'Boys', 'b': 'Boys', 'G': 'Girls', 'g': 'Girls'}
+_YEAR_DIGITS_GROUP = {
+    'apostrophe_year_gender': 'year2_gender',
+    'year_gender': 'year4_gender',
+    'apostrophe_year': 'year2',
+    'year_only': 'year4',
+}
+
+
+class ParsedTeam(NamedTuple):
+    """Parsed team name; fields match the parse_team_name() dictionary."""
+    club_name: Optional[str]
+    birth_year: Optional[int]
+    gender: Optional[str]
+    designation: Optional[str]
+    original_name: str
+    parsed: bool
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the parse result as a parse_team_name() dictionary."""
+        return dict(zip(self._fields, self))
+
+
+def _clean_club(club_part: str) -> str:
+    """Collapse whitespace runs and strip surrounding spaces/dashes from a club name."""
+    return ' '.join(club_part.split()).strip(' -')
+
+
+def _clean_designation(designation_part: str) -> str:
+    """Strip whitespace and any leading dash separators from a designation."""
+    designation_part = designation_part.strip()
+    while designation_part.startswith('-'):
+        designation_part = designation_part.lstrip('-').lstrip()
+    return designation_part
+
+
+def _split_name_around(name: str, start: int, end: int) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Split a team name into club name and designation around its year pattern.
+    
+    Parameters
+    ----------
+    name : str
+        Stripped team name
+    start : int
+        Start index of the year pattern
+    end : int
+        End index of the year pattern
+        
+    Returns
+    -------
+    Tuple[Optional[str], Optional[str]]
+        Cleaned club name and designation (None when empty)
+    """
+    return _clean_club(name[:start]) or None, _clean_designation(name[end:]) or None
+
+
+def _infer_gender(name: str) -> Optional[str]:
+    """Infer the gender from Boys/Girls words in a team name, if present."""
+    name_lower = name.lower()
+    if 'boys' in name_lower or ' boy' in name_lower:
+        return 'Boys'
+    if 'girls' in name_lower or ' girl' in name_lower:
+        return 'Girls'
+    return None
+
+
+def _scan_year_gender(name: str) -> int:
+    """
+    Find the first four-digit year + B/G token without the regex engine.
+    
+    Same match as a search for ``(\\d{4})[BG]\\b`` (case-insensitive):
+    the scan goes left to right over the gender letters and checks the four
+    digits before and the word boundary after each one.
+    
+    Parameters
+    ----------
+    name : str
+        Stripped team name
+        
+    Returns
+    -------
+    int
+        Start index of the year, or -1 if there is no such token
+    """
+    length = len(name)
+    for pos in range(4, length):
+        if name[pos] in 'BGbg' and name[pos - 4:pos].isdecimal():
+            after = pos + 1
+            if after == length or not (name[after].isalnum() or name[after] == '_'):
+                return pos - 4
+    return -1
+
+
+def _find_year_match(name: str) -> Tuple[Optional[str], str, int, int]:
+    """
+    Find the year pattern that parse_team_name() should use, in one scan.
+    
+    The patterns are tried by precedence, not position: an apostrophe year
+    with gender anywhere in the name wins over a four-digit year before it.
+    Matches of the fused pattern never overlap a match of another pattern
+    that could take precedence, so the first match of each kind is the same
+    one a separate search for that pattern would find.
+    
+    Parameters
+    ----------
+    name : str
+        Stripped team name
+        
+    Returns
+    -------
+    Tuple[Optional[str], str, int, int]
+        Name of the matched pattern group, the year digits and the start/end
+        of the match, or (None, '', 0, 0)
+    """
+    # Without an apostrophe a year+gender match can't be beaten either; the
+    # common well-formed "Club 2013B - Color" names are found without regex
+    has_apostrophe = "'" in name
+    if not has_apostrophe:
+        start = _scan_year_gender(name)
+        if start >= 0:
+            return 'year_gender', name[start:start + 4], start, start + 5
+    
+    first: Dict[str, re.Match] = {}
+    for match in _YEAR_PATTERNS_RE.finditer(name):
+        kind = match.lastgroup
+        if kind == 'apostrophe_year_gender':
+            # Highest precedence - nothing later can beat it
+            return kind, match.group('year2_gender'), match.start(), match.end()
+        first.setdefault(kind, match)
+    for kind in _YEAR_PATTERN_PRECEDENCE:
+        if kind in first:
+            match = first[kind]
+            year_digits = match.group(_YEAR_DIGITS_GROUP[kind])
+            return kind, year_digits, match.start(), match.end()
+    return None, '', 0, 0
+
 
 def parse_team_name(team_name: str) -> Dict[str, Any]:
     """
@@ -39,183 +191,82 @@ def parse_team_name(team_name: str) -> Dict[str, Any]:
         - original_name: str - Original team name
         - parsed: bool - Whether parsing was successful
     """
+    # The cache holds immutable records, so every caller gets its own dict
+    return parse_team_name_record(team_name).as_dict()
+
+
+@lru_cache(maxsize=4096)
+def parse_team_name_record(team_name: str) -> ParsedTeam:
+    """
+    Parse a team name into an immutable ParsedTeam record.
+    
+    Same result as parse_team_name(), but as a named tuple with attribute
+    access and no per-call dictionary. Team names repeat across seasons and
+    matches, so results are memoized per distinct name.
+    
+    Parameters
+    ----------
+    team_name : str
+        Original team name to parse
+        
+    Returns
+    -------
+    ParsedTeam
+        Parsed team name data
+    """
     original_name = team_name.strip()
-    result: Dict[str, Any] = {
-        'club_name': None,
-        'birth_year': None,
-        'gender': None,
-        'designation': None,
-        'original_name': original_name,
-        'parsed': False
-    }
+    unparsed = ParsedTeam(None, None, None, None, original_name, False)
     
     if not team_name or not team_name.strip():
-        return result
+        return unparsed
     
     # Normalize the name for parsing
     name = team_name.strip()
     
-    # Pattern 1: Two-digit year with apostrophe (e.g., "'04B", "'13G")
-    # Check this first before 4-digit patterns
-    apostrophe_pattern = r"'(\d{2})[BG]\b"
-    match = re.search(apostrophe_pattern, name, re.IGNORECASE)
+    # Every year pattern needs a digit; names without one (club only, "TBD",
+    # "Bye") can't match, so skip the regex scan entirely
+    if not any(map(str.isdigit, name)):
+        return unparsed
     
-    if match:
-        two_digit = int(match.group(1))
-        # Assume years 00-30 are 2000-2030, 31-99 are 1931-1999
-        if two_digit <= 30:
-            birth_year = 2000 + two_digit
-        else:
-            birth_year = 1900 + two_digit
-        
-        result['birth_year'] = birth_year
-        
-        # Extract gender
-        gender_char = name[match.end() - 1].upper()
-        if gender_char == 'B':
-            result['gender'] = 'Boys'
-        elif gender_char == 'G':
-            result['gender'] = 'Girls'
-        
-        # Extract club name
-        club_part = name[:match.start()].strip()
-        if club_part:
-            club_part = re.sub(r'\s+', ' ', club_part)
-            club_part = club_part.strip(' -')
-            if club_part:
-                result['club_name'] = club_part
-        
-        # Extract designation
-        designation_part = name[match.end():].strip()
-        if designation_part:
-            designation_part = re.sub(r'^[-\s]+', '', designation_part)
-            designation_part = designation_part.strip()
-            if designation_part:
-                result['designation'] = designation_part
-        
-        result['parsed'] = True
-        return result
-    
-    # Pattern 2: Four-digit year followed by B or G (e.g., "2013B", "2010G")
-    year_gender_pattern = r"(\d{4})[BG]\b"
-    match = re.search(year_gender_pattern, name, re.IGNORECASE)
+    # Classify the name with a single scan for all four year patterns
+    kind, year_digits, start, end = _find_year_match(name)
     
-    if match:
-        birth_year = int(match.group(1))
-        
-        result['birth_year'] = birth_year
-        
-        # Extract gender from the pattern
-        gender_char = name[match.end() - 1].upper()
-        if gender_char == 'B':
-            result['gender'] = 'Boys'
-        elif gender_char == 'G':
-            result['gender'] = 'Girls'
-        
-        # Extract club name (everything before the year pattern)
-        club_part = name[:match.start()].strip()
-        if club_part:
-            # Clean up common prefixes/suffixes
-            club_part = re.sub(r'\s+', ' ', club_part)
-            club_part = club_part.strip(' -')
-            if club_part:
-                result['club_name'] = club_part
-        
-        # Extract designation (everything after the year+gender pattern)
-        designation_part = name[match.end():].strip()
-        if designation_part:
-            # Remove common separators
-            designation_part = re.sub(r'^[-\s]+', '', designation_part)
-            designation_part = designation_part.strip()
-            if designation_part:
-                result['designation'] = designation_part
-        
-        result['parsed'] = True
-        return result
-    
-    # Pattern 3: Two-digit year with apostrophe but no B/G (e.g., "'04 BLACK")
-    # Try to infer gender from designation or context
-    apostrophe_no_gender = r"'(\d{2})\b"
-    match = re.search(apostrophe_no_gender, name)
-    if match:
-        two_digit = int(match.group(1))
-        if two_digit <= 30:
-            birth_year = 2000 + two_digit
-        else:
-            birth_year = 1900 + two_digit
-        
-        result['birth_year'] = birth_year
-        
+    if kind == 'apostrophe_year_gender':
+        # Pattern 1: Two-digit year with apostrophe (e.g., "'04B", "'13G")
+        # Takes precedence over 4-digit patterns
+        birth_year = _TWO_DIGIT_YEARS[int(year_digits)]
+        gender = _GENDER_NAMES.get(name[end - 1])
+    elif kind == 'year_gender':
+        # Pattern 2: Four-digit year followed by B or G (e.g., "2013B", "2010G")
+        birth_year = int(year_digits)
+        gender = _GENDER_NAMES.get(name[end - 1])
+    elif kind == 'apostrophe_year':
+        # Pattern 3: Two-digit year with apostrophe but no B/G (e.g., "'04 BLACK")
         # Try to infer gender from context
-        name_lower = name.lower()
-        if 'boys' in name_lower or ' boy' in name_lower:
-            result['gender'] = 'Boys'
-        elif 'girls' in name_lower or ' girl' in name_lower:
-            result['gender'] = 'Girls'
-        
-        # Extract club name
-        club_part = name[:match.start()].strip()
-        if club_part:
-            club_part = re.sub(r'\s+', ' ', club_part)
-            club_part = club_part.strip(' -')
-            if club_part:
-                result['club_name'] = club_part
-        
-        # Extract designation
-        designation_part = name[match.end():].strip()
-        if designation_part:
-            designation_part = re.sub(r'^[-\s]+', '', designation_part)
-            designation_part = designation_part.strip()
-            if designation_part:
-                result['designation'] = designation_part
-        
-        if result['birth_year']:
-            result['parsed'] = True
-            return result
-    
-    # Pattern 4: Try to find just year patterns without explicit B/G
-    # Look for 4-digit years that might be birth years (2000-2030 range)
-    year_only_pattern = r'\b(20[0-3]\d)\b'
-    matches = list(re.finditer(year_only_pattern, name))
-    
-    if matches:
-        # Try to infer gender from context (Boys/Girls in name)
-        gender = None
-        name_lower = name.lower()
-        if 'boys' in name_lower or ' boy' in name_lower:
-            gender = 'Boys'
-        elif 'girls' in name_lower or ' girl' in name_lower:
-            gender = 'Girls'
-        
-        # Use the most likely birth year (usually the first 4-digit year)
-        birth_year = int(matches[0].group(1))
-        result['birth_year'] = birth_year
-        if gender:
-            result['gender'] = gender
-        
-        # Extract club name
-        club_part = name[:matches[0].start()].strip()
-        if club_part:
-            club_part = re.sub(r'\s+', ' ', club_part)
-            club_part = club_part.strip(' -')
-            if club_part:
-                result['club_name'] = club_part
-        
-        # Extract designation (after the year)
-        designation_part = name[matches[0].end():].strip()
-        if designation_part:
-            designation_part = re.sub(r'^[-\s]+', '', designation_part)
-            designation_part = designation_part.strip()
-            if designation_part:
-                result['designation'] = designation_part
-        
-        if result['birth_year']:
-            result['parsed'] = True
+        birth_year = _TWO_DIGIT_YEARS[int(year_digits)]
+        gender = _infer_gender(name)
+    elif kind == 'year_only':
+        # Pattern 4: Just a year without explicit B/G, taking the first 4-digit
+        # year that might be a birth year (2000-2039)
+        birth_year = int(year_digits)
+        gender = _infer_gender(name)
+    else:
+        return unparsed
     
-    return result
+    # Club name is everything before the year pattern, designation everything after
+    club_name, designation = _split_name_around(name, start, end)
+    return ParsedTeam(club_name, birth_year, gender, designation, original_name, True)
 
 
-def normalize_team_identifier(parsed: Dict[str, Any]) -> str:
+def _identifier_fields(parsed: Union[Dict[str, Any], ParsedTeam]) -> Tuple[Any, ...]:
+    """Return (club_name, birth_year, gender, designation, original_name) from a parse result."""
+    if isinstance(parsed, ParsedTeam):
+        return parsed.club_name, parsed.birth_year, parsed.gender, parsed.designation, parsed.original_name
+    return (parsed.get('club_name'), parsed.get('birth_year'), parsed.get('gender'),
+            parsed.get('designation'), parsed.get('original_name', ''))
+
+
+def normalize_team_identifier(parsed: Union[Dict[str, Any], ParsedTeam]) -> str:
     """
     Create a canonical identifier for matching teams across seasons.
     
@@ -224,73 +275,75 @@ def normalize_team_identifier(parsed: Dict[str, Any]) -> str:
     
     Parameters
     ----------
-    parsed : Dict[str, Any]
-        Parsed team name data from parse_team_name()
+    parsed : Union[Dict[str, Any], ParsedTeam]
+        Parsed team name data from parse_team_name() or parse_team_name_record()
         
     Returns
     -------
     str
         Normalized identifier string
     """
-    parts: List[str] = []
-    
-    # Club name (normalized)
-    if parsed.get('club_name'):
-        club = parsed['club_name'].strip().upper()
-        club = re.sub(r'\s+', ' ', club)
-        parts.append(club)
-    
-    # Birth year
-    if parsed.get('birth_year'):
-        parts.append(str(parsed['birth_year']))
-    
-    # Gender
-    if parsed.get('gender'):
-        gender_short = parsed['gender'][0].upper()  # 'B' or 'G'
-        parts.append(gender_short)
+    return _normalize_team_identifier(*_identifier_fields(parsed))
+
+
+@lru_cache(maxsize=4096)
+def _normalize_team_identifier(club_name: Optional[str], birth_year: Optional[int], gender: Optional[str],
+                               designation: Optional[str], original_name: str) -> str:
+    """Memoized normalize_team_identifier(), keyed on the parsed fields it uses."""
+    # Club + birth year + gender is exactly the base identifier; reuse it
+    base = _extract_base_identifier(club_name, birth_year, gender, original_name)
+    if not designation:
+        return base
     
     # Designation (optional, for differentiation)
-    if parsed.get('designation'):
-        designation = parsed['designation'].strip().upper()
-        designation = re.sub(r'\s+', ' ', designation)
-        # Normalize common variations
-        designation = re.sub(r'\s*-\s*', '', designation)
-        parts.append(designation)
+    designation = ' '.join(designation.upper().split())
+    # Normalize common variations: drop dashes along with the spaces around them
+    designation = ''.join(part.strip(' ') for part in designation.split('-'))
     
-    return '|'.join(parts) if parts else parsed.get('original_name', '').upper()
+    # Without club/year/gender the base falls back to the original name; don't prefix that
+    if not (club_name or birth_year or gender):
+        return designation
+    return f"{base}|{designation}"
 
 
-def extract_base_identifier(parsed: Dict[str, Any]) -> str:
+def extract_base_identifier(parsed: Union[Dict[str, Any], ParsedTeam]) -> str:
     """
     Extract base identifier without designation (for matching teams that may have
     designation added in later years).
     
     Parameters
     ----------
-    parsed : Dict[str, Any]
-        Parsed team name data from parse_team_name()
+    parsed : Union[Dict[str, Any], ParsedTeam]
+        Parsed team name data from parse_team_name() or parse_team_name_record()
         
     Returns
     -------
     str
         Base identifier (club + birth_year + gender, no designation)
     """
+    club_name, birth_year, gender, _, original_name = _identifier_fields(parsed)
+    return _extract_base_identifier(club_name, birth_year, gender, original_name)
+
+
+@lru_cache(maxsize=4096)
+def _extract_base_identifier(club_name: Optional[str], birth_year: Optional[int], gender: Optional[str],
+                             original_name: str) -> str:
+    """Memoized extract_base_identifier(), keyed on the parsed fields it uses."""
     parts: List[str] = []
     
     # Club name
-    if parsed.get('club_name'):
-        club = parsed['club_name'].strip().upper()
-        club = re.sub(r'\s+', ' ', club)
+    if club_name:
+        club = ' '.join(club_name.upper().split())
         parts.append(club)
     
     # Birth year
-    if parsed.get('birth_year'):
-        parts.append(str(parsed['birth_year']))
+    if birth_year:
+        parts.append(str(birth_year))
     
     # Gender
-    if parsed.get('gender'):
-        gender_short = parsed['gender'][0].upper()
+    if gender:
+        gender_short = gender[0].upper()
         parts.append(gender_short)
     
-    return '|'.join(parts) if parts else parsed.get('original_name', '').upper()
+    return '|'.join(parts) if parts else original_name.upper()
 
@@ -6,8 +6,10 @@ This scraper uses Selenium to fetch fully rendered HTML pages with JavaScript
 execution, which is necessary to get the complete standings page including
 the match schedule table (row2).
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator, Tuple
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import queue
 import time
 import json
 from selenium import webdriver
@@ -54,14 +56,38 @@ class GVSAScraperSelenium:
         self.headless = headless
         self.delay = delay
         self.driver: Optional[webdriver.Remote] = None
+        # Extra drivers started for parallel fetching; quit in close()
+        self._pool_drivers: List[webdriver.Remote] = []
         
         # Create cache directory
         self.CACHE_DIR.mkdir(exist_ok=True)
         
-        self._init_driver()
+        # Plain HTTP scraper shared for season/division listings and the HTML cache,
+        # created on first use by _get_html_helper()
+        self._html_helper: Optional[Any] = None
+        
+        # The WebDriver is started lazily, only once a page actually has to be fetched
+    
+    def _get_html_helper(self) -> Any:
+        """Return the shared plain HTTP scraper, creating it on first use."""
+        if self._html_helper is None:
+            from gvsa.scraper import GVSAScraper
+            self._html_helper = GVSAScraper(use_cache=True)
+        return self._html_helper
     
     def _init_driver(self) -> None:
         """Initialize the Selenium WebDriver."""
+        self.driver = self._create_driver()
+    
+    def _create_driver(self) -> webdriver.Remote:
+        """
+        Create a new Selenium WebDriver for the configured browser.
+        
+        Returns
+        -------
+        webdriver.Remote
+            Configured WebDriver instance
+        """
         try:
             if self.browser_type.lower() == "firefox":
                 options = FirefoxOptions()
@@ -69,8 +95,15 @@ class GVSAScraperSelenium:
                     options.add_argument("--headless")
                 options.set_preference("general.useragent.override", 
                                      "Mozilla/5.0 (X11; Linux x86_64; rv:144.0) Gecko/20100101 Firefox/144.0")
+                # Only the standings tables are needed: skip images, stylesheets and web fonts
+                options.set_preference("permissions.default.image", 2)
+                options.set_preference("permissions.default.stylesheet", 2)
+                options.set_preference("gfx.downloadable_fonts.enabled", False)
+                options.set_preference("dom.webnotifications.enabled", False)
+                # Return from driver.get() on DOMContentLoaded; rendering is awaited explicitly
+                options.page_load_strategy = "eager"
                 service = FirefoxService(GeckoDriverManager().install())
-                self.driver = webdriver.Firefox(service=service, options=options)
+                driver = webdriver.Firefox(service=service, options=options)
             else:  # chrome
                 options = ChromeOptions()
                 if self.headless:
@@ -78,22 +111,120 @@ class GVSAScraperSelenium:
                 options.add_argument("--no-sandbox")
                 options.add_argument("--disable-dev-shm-usage")
                 options.add_argument("user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36")
+                options.add_experimental_option("prefs", {
+                    "profile.managed_default_content_settings.images": 2,
+                    "profile.managed_default_content_settings.stylesheets": 2,
+                    "profile.managed_default_content_settings.notifications": 2,
+                })
+                options.page_load_strategy = "eager"
                 service = ChromeService(ChromeDriverManager().install())
-                self.driver = webdriver.Chrome(service=service, options=options)
+                driver = webdriver.Chrome(service=service, options=options)
             
-            self.driver.set_page_load_timeout(30)
+            driver.set_page_load_timeout(30)
             print(f"✓ Initialized {self.browser_type} WebDriver")
+            return driver
         except Exception as e:
             print(f"Error initializing WebDriver: {e}")
             raise
     
+    @staticmethod
+    def _wait_for(driver: webdriver.Remote, condition: Any, timeout: float) -> bool:
+        """
+        Wait until a WebDriverWait condition holds, without raising on timeout.
+        
+        Returns as soon as the condition is true, so it replaces fixed sleeps
+        of up to ``timeout`` seconds.
+        
+        Parameters
+        ----------
+        driver : webdriver.Remote
+            WebDriver to wait on
+        condition : Any
+            Expected condition (e.g. from selenium's expected_conditions) or
+            callable taking the driver
+        timeout : float
+            Maximum time to wait in seconds
+            
+        Returns
+        -------
+        bool
+            True if the condition was met, False on timeout
+        """
+        try:
+            WebDriverWait(driver, timeout).until(condition)
+            return True
+        except TimeoutException:
+            return False
+    
+    @staticmethod
+    def _parse_cached_standings(html_scraper: Any, division: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Parse standings from cached HTML if it already contains the row2 table.
+        
+        Parameters
+        ----------
+        html_scraper : Any
+            GVSAScraper instance used to read the HTML cache
+        division : Dict[str, Any]
+            Division dictionary
+            
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            Parsed standings data, or None if the page must be fetched
+        """
+        cached_html = html_scraper.get_cached_html(division)
+        if not cached_html or 'id="row2"' not in cached_html:
+            return None
+        standings_data = parse_standings(cached_html)
+        standings_data['division'] = division
+        return standings_data
+    
     def close(self) -> None:
-        """Close the WebDriver."""
+        """Close the WebDriver and any pooled drivers."""
         if self.driver:
             self.driver.quit()
             self.driver = None
+        while self._pool_drivers:
+            self._pool_drivers.pop().quit()
+    
+    def _fetch_with_driver_pool(self, divisions: List[Dict[str, Any]],
+                                max_workers: int) -> Iterator[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]]:
+        """
+        Fetch divisions concurrently, each worker thread borrowing a warm driver from a pool.
+        
+        Parameters
+        ----------
+        divisions : List[Dict[str, Any]]
+            Divisions to fetch
+        max_workers : int
+            Number of WebDriver instances (and worker threads) to run
+            
+        Yields
+        ------
+        Tuple[Dict[str, Any], Optional[Dict[str, Any]]]
+            (division, parsed standings or None) in completion order
+        """
+        drivers: queue.Queue = queue.Queue()
+        for _ in range(max_workers):
+            driver = self._create_driver()
+            self._pool_drivers.append(driver)
+            drivers.put(driver)
+        
+        def fetch(division: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            driver = drivers.get()
+            try:
+                return self.get_standings_with_selenium(division, force_refresh=True, driver=driver)
+            finally:
+                drivers.put(driver)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(fetch, division): division for division in divisions}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
     
-    def get_standings_with_selenium(self, division: Dict[str, Any], force_refresh: bool = False) -> Optional[Dict[str, Any]]:
+    def get_standings_with_selenium(self, division: Dict[str, Any], force_refresh: bool = False,
+                                   driver: Optional[webdriver.Remote] = None) -> Optional[Dict[str, Any]]:
         """
         Fetch standings using Selenium to get fully rendered page with matches.
         
@@ -103,39 +234,39 @@ class GVSAScraperSelenium:
             Division dictionary
         force_refresh : bool
             Force refresh even if cached (default: False)
+        driver : Optional[webdriver.Remote]
+            WebDriver to fetch with (default: this scraper's own driver)
             
         Returns
         -------
         Optional[Dict[str, Any]]
             Parsed standings data or None if request fails
         """
-        if not self.driver:
-            self._init_driver()
-        
         # Check cache first
         if not force_refresh:
-            from scraper import GVSAScraper
-            html_scraper = GVSAScraper(use_cache=True)
-            cached_html = html_scraper.get_cached_html(division)
-            if cached_html and 'id="row2"' in cached_html:
+            standings_data = self._parse_cached_standings(self._get_html_helper(), division)
+            if standings_data is not None:
                 # Already have cached HTML with row2 table
                 print(f"  Using cached HTML with row2 table")
-                standings_data = parse_standings(cached_html)
-                standings_data['division'] = division
                 return standings_data
         
+        if driver is None:
+            if not self.driver:
+                self._init_driver()
+            driver = self.driver
+        
         try:
             # Step 1: Go to seasons.jsp first and select Fall 2025
             seasons_url = f"{self.BASE_URL}/seasons.jsp"
             print(f"  Step 1: Loading {seasons_url}...")
-            self.driver.get(seasons_url)
-            time.sleep(2)
+            driver.get(seasons_url)
             
             # Select Fall 2025 season
             try:
-                season_select = Select(WebDriverWait(self.driver, 10).until(
+                season_element = WebDriverWait(driver, 10).until(
                     EC.presence_of_element_located((By.NAME, "season"))
-                ))
+                )
+                season_select = Select(season_element)
                 
                 # Find Fall 2025
                 season_value = None
@@ -146,22 +277,20 @@ class GVSAScraperSelenium:
                 
                 if season_value:
                     season_select.select_by_value(season_value)
-                    # Wait for form to auto-submit (if it has onchange)
-                    time.sleep(3)
+                    # Wait for form to auto-submit (if it has onchange): the old select goes stale
+                    self._wait_for(driver, EC.staleness_of(season_element), 3)
                     print(f"  ✓ Selected Fall 2025 season")
             except (NoSuchElementException, TimeoutException) as e:
                 print(f"  ⚠ Could not select season: {e}")
             
             # Step 2: Navigate to standings page (may already be there after season selection)
             url = f"{self.BASE_URL}/standings.jsp"
-            current_url = self.driver.current_url
+            current_url = driver.current_url
             if 'standings.jsp' not in current_url:
                 print(f"  Step 2: Loading {url}...")
-                self.driver.get(url)
-                time.sleep(2)  # Wait for page to load
+                driver.get(url)
             else:
                 print(f"  Step 2: Already on standings page")
-                time.sleep(2)
             
             # Select division from dropdown
             # Format with exact spacing/padding as seen in mitm logs
@@ -178,7 +307,7 @@ class GVSAScraperSelenium:
             )
             
             try:
-                division_select = WebDriverWait(self.driver, 10).until(
+                division_select = WebDriverWait(driver, 10).until(
                     EC.presence_of_element_located((By.NAME, "division"))
                 )
                 select = Select(division_select)
@@ -203,18 +332,12 @@ class GVSAScraperSelenium:
                     if not found:
                         raise ValueError("Division not found in dropdown")
                 
-                # Wait for page to update (check if form auto-submits)
-                time.sleep(2)
-                
-                # Check if page URL changed or form was submitted
-                current_url = self.driver.current_url
-                if 'division' not in current_url:
-                    # Form might have auto-submitted, wait for it
-                    time.sleep(3)
+                # Wait for page to update (if the form auto-submits, the old select goes stale)
+                self._wait_for(driver, EC.staleness_of(division_select), 5)
                 
                 # Wait for both tables to load
                 try:
-                    WebDriverWait(self.driver, 15).until(
+                    WebDriverWait(driver, 15).until(
                         lambda d: len(d.find_elements(By.CSS_SELECTOR, "table")) >= 2 or
                                   d.find_elements(By.CSS_SELECTOR, "table#row2")
                     )
@@ -226,85 +349,74 @@ class GVSAScraperSelenium:
                 # Fallback: use POST request to standings.jsp
                 print(f"  Dropdown method failed, using POST request...")
                 # Use JavaScript to submit form or direct POST
-                self.driver.get(url)
-                time.sleep(2)
+                driver.get(url)
+                self._wait_for(driver, EC.presence_of_element_located((By.TAG_NAME, "form")), 10)
                 
                 # Try to find and fill a form
+                old_page = driver.find_element(By.TAG_NAME, "html")
                 try:
                     # Look for form with division input
-                    form = self.driver.find_element(By.TAG_NAME, "form")
+                    form = driver.find_element(By.TAG_NAME, "form")
                     division_input = form.find_element(By.NAME, "division")
                     division_input.clear()
                     division_input.send_keys(division_param)
                     form.submit()
-                    time.sleep(4)  # Wait for page to load
                 except:
                     # Last resort: use JavaScript to set location
-                    self.driver.execute_script(f"window.location.href = '{url}?division={division_param}';")
-                    time.sleep(4)
+                    driver.execute_script(f"window.location.href = '{url}?division={division_param}';")
+                # Wait for the new page to replace the old one
+                self._wait_for(driver, EC.staleness_of(old_page), 4)
             
             # Wait for tables to load
             try:
-                WebDriverWait(self.driver, 10).until(
+                WebDriverWait(driver, 10).until(
                     EC.presence_of_element_located((By.TAG_NAME, "table"))
                 )
             except TimeoutException:
                 pass
             
             # Scroll down to trigger lazy loading of match table
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
+            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
             
             # Wait specifically for row2 table
             try:
-                WebDriverWait(self.driver, 10).until(
+                WebDriverWait(driver, 10).until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, "table#row2"))
                 )
                 print(f"  ✓ Found row2 table after waiting")
             except TimeoutException:
                 # Try waiting for any table with "Game No" header
                 try:
-                    WebDriverWait(self.driver, 5).until(
+                    WebDriverWait(driver, 5).until(
                         EC.presence_of_element_located((By.XPATH, "//th[contains(text(), 'Game No')]"))
                     )
                     print(f"  ✓ Found 'Game No' header")
                 except TimeoutException:
                     pass
             
-            # Additional wait for JavaScript to fully render
-            time.sleep(3)
-            
             # Wait for network requests to complete (check for AJAX)
             try:
                 # Wait for jQuery to finish (if used)
-                WebDriverWait(self.driver, 10).until(
+                WebDriverWait(driver, 10).until(
                     lambda d: d.execute_script("return jQuery.active == 0") if d.execute_script("return typeof jQuery !== 'undefined'") else True
                 )
             except:
                 pass
             
             # Wait for document ready state
-            WebDriverWait(self.driver, 10).until(
+            WebDriverWait(driver, 10).until(
                 lambda d: d.execute_script("return document.readyState") == "complete"
             )
             
-            # Scroll back up and down again to ensure everything is loaded
-            self.driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(1)
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(3)  # Increased wait
-            
-            # One more check for row2 table
-            try:
-                WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "table#row2, table[id='row2']"))
-                )
-                print(f"  ✓ Found row2 table after scrolling and waiting")
-            except TimeoutException:
-                pass
+            # Only scroll again if the row2 table has not shown up yet
+            if not driver.find_elements(By.CSS_SELECTOR, "table#row2"):
+                driver.execute_script("window.scrollTo(0, 0);")
+                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                if self._wait_for(driver, EC.presence_of_element_located((By.CSS_SELECTOR, "table#row2")), 5):
+                    print(f"  ✓ Found row2 table after scrolling and waiting")
             
             # Get the fully rendered HTML
-            html_content = self.driver.page_source
+            html_content = driver.page_source
             
             # Check if we got the row2 table
             has_row2 = 'id="row2"' in html_content or "id='row2'" in html_content
@@ -314,9 +426,7 @@ class GVSAScraperSelenium:
                 print(f"  ⚠ No row2 table found (may need more wait time)")
             
             # Save to cache
-            from scraper import GVSAScraper
-            html_scraper = GVSAScraper(use_cache=True)
-            html_scraper.save_html_cache(division, html_content)
+            self._get_html_helper().save_html_cache(division, html_content)
             
             # Parse the HTML
             standings_data = parse_standings(html_content)
@@ -331,7 +441,8 @@ class GVSAScraperSelenium:
             print(f"  Error fetching with Selenium: {e}")
             return None
     
-    def scrape_divisions_with_matches(self, season_name: str = "Fall 2025", db: Optional[GVSA_Database] = None) -> List[Dict[str, Any]]:
+    def scrape_divisions_with_matches(self, season_name: str = "Fall 2025", db: Optional[GVSA_Database] = None,
+                                      max_workers: int = 1) -> List[Dict[str, Any]]:
         """
         Scrape divisions for a specific season using Selenium to get matches.
         
@@ -341,19 +452,17 @@ class GVSAScraperSelenium:
             Season name (default: "Fall 2025")
         db : Optional[GVSA_Database]
             Database instance to save data to
+        max_workers : int
+            Number of browsers fetching divisions concurrently (default: 1)
             
         Returns
         -------
         List[Dict[str, Any]]
             List of parsed standings data
         """
-        if not self.driver:
-            self._init_driver()
-        
         try:
             # Get seasons and divisions using regular scraper
-            from scraper import GVSAScraper
-            html_scraper = GVSAScraper(use_cache=True)
+            html_scraper = self._get_html_helper()
             seasons = html_scraper.get_seasons()
             
             # Find the target season
@@ -373,10 +482,29 @@ class GVSAScraperSelenium:
             
             all_standings: List[Dict[str, Any]] = []
             
-            # Fetch each division with Selenium
-            for i, division in enumerate(divisions, 1):
-                print(f"\n[{i}/{len(divisions)}] {division['display_name']}")
-                standings = self.get_standings_with_selenium(division, force_refresh=False)
+            # Parse cache hits first; the WebDriver is only started if something is missing
+            misses: List[Dict[str, Any]] = []
+            for division in divisions:
+                standings = self._parse_cached_standings(html_scraper, division)
+                if standings is None:
+                    misses.append(division)
+                    continue
+                if db:
+                    db.save_standings(standings)
+                all_standings.append(standings)
+            print(f"  {len(all_standings)} divisions loaded from cache, {len(misses)} to fetch")
+            
+            # Fetch each remaining division with Selenium
+            workers = max(1, min(max_workers, len(misses)))
+            if workers > 1:
+                results = self._fetch_with_driver_pool(misses, workers)
+            else:
+                results = ((division, self.get_standings_with_selenium(division, force_refresh=True))
+                           for division in misses)
+            
+            # Results are consumed here, so database writes stay on this thread
+            for i, (division, standings) in enumerate(results, 1):
+                print(f"\n[{i}/{len(misses)}] {division['display_name']}")
                 
                 if standings:
                     if db:
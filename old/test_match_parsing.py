@@ -27,7 +27,7 @@ def analyze_html_file(html_file: Path) -> None:
     print(f"{'='*80}")
     
     html_content = html_file.read_text(encoding='utf-8')
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = BeautifulSoup(html_content, 'lxml')
     
     # Find all tables
     all_tables = soup.find_all('table')
@@ -46,7 +46,7 @@ def analyze_html_file(html_file: Path) -> None:
         # Check first row
         first_row = table.find('tr')
         if first_row:
-            first_cells = [cell.get_text(strip=True) for cell in first_row.find_all(['th', 'td'])]
+            first_cells = [cell.get_text(strip=True) for cell in first_row.find_all(['th', 'td'], recursive=False)]
             print(f"  First row: {first_cells}")
         
         # Check for "Game No" text
@@ -58,12 +58,12 @@ def analyze_html_file(html_file: Path) -> None:
             for j, row in enumerate(rows):
                 row_text = row.get_text()
                 if 'Game No' in row_text or 'game no' in row_text.lower():
-                    cells = row.find_all(['th', 'td'])
+                    cells = row.find_all(['th', 'td'], recursive=False)
                     cell_texts = [cell.get_text(strip=True) for cell in cells]
                     print(f"    Row {j} contains 'Game No': {cell_texts}")
                     # Show next few rows
                     for k in range(j+1, min(j+4, len(rows))):
-                        next_cells = rows[k].find_all(['th', 'td'])
+                        next_cells = rows[k].find_all(['th', 'td'], recursive=False)
                         next_texts = [cell.get_text(strip=True) for cell in next_cells]
                         print(f"      Row {k}: {next_texts}")
         
@@ -9,19 +9,32 @@ This script checks:
 """
 from pathlib import Path
 from bs4 import BeautifulSoup
-from typing import List, Dict, Any, Set
+from typing import List, Dict, Any, Set, Optional, Tuple, Union
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 import json
+import os
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
-def analyze_table_structure(html_content: str, file_path: str) -> Dict[str, Any]:
+# Analyses from previous runs, keyed by path and checked against mtime_ns and
+# size; bump the version whenever analyze_table_structure() output changes
+ANALYSIS_CACHE_FILE = Path(__file__).with_name(".table_analysis.json")
+ANALYSIS_CACHE_VERSION = 3
+
+
+def analyze_table_structure(html_content: Union[str, bytes], file_path: str) -> Dict[str, Any]:
     """
     Analyze the structure of the standings table in detail.
     
     Parameters
     ----------
-    html_content : str
-        HTML content to analyze
+    html_content : Union[str, bytes]
+        HTML content to analyze (bytes are the UTF-8 cache file contents)
     file_path : str
         Path to the file
         
@@ -30,12 +43,12 @@ def analyze_table_structure(html_content: str, file_path: str) -> Dict[str, Any]
     Dict[str, Any]
         Detailed analysis of table structure
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
+    # Bytes go straight to lxml; cache files are UTF-8 whatever their <meta> says
+    soup = BeautifulSoup(html_content, 'lxml', from_encoding='utf-8' if isinstance(html_content, bytes) else None)
     analysis: Dict[str, Any] = {
         'file': str(file_path),
         'table_found': False,
         'thead_columns': [],
-        'tbody_rows': [],
         'row_variations': defaultdict(int),
         'parsing_issues': [],
         'sample_data': []
@@ -54,7 +67,7 @@ def analyze_table_structure(html_content: str, file_path: str) -> Dict[str, Any]
     if thead:
         header_row = thead.find('tr')
         if header_row:
-            headers = header_row.find_all(['th', 'td'])
+            headers = header_row.find_all(['th', 'td'], recursive=False)
             analysis['thead_columns'] = [h.get_text(strip=True) for h in headers]
     
     # Analyze body rows
@@ -65,17 +78,12 @@ def analyze_table_structure(html_content: str, file_path: str) -> Dict[str, Any]
     
     rows = tbody.find_all('tr')
     for row_idx, row in enumerate(rows):
-        cells = row.find_all('td')
+        cells = row.find_all('td', recursive=False)
         cell_count = len(cells)
-        cell_texts = [cell.get_text(strip=True) for cell in cells]
         
-        # Track row variations
+        # Track row variations (per-row cell texts are not kept; only the
+        # first few rows are sampled below)
         analysis['row_variations'][cell_count] += 1
-        analysis['tbody_rows'].append({
-            'row_index': row_idx,
-            'cell_count': cell_count,
-            'cells': cell_texts
-        })
         
         # Check for parsing issues
         if cell_count < 9:
@@ -85,11 +93,80 @@ def analyze_table_structure(html_content: str, file_path: str) -> Dict[str, Any]
         
         # Sample first few rows
         if row_idx < 3:
-            analysis['sample_data'].append(cell_texts)
+            analysis['sample_data'].append([cell.get_text(strip=True) for cell in cells])
     
     return analysis
 
 
+def _analyze_file(path: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Read and analyze one cached HTML file (runs in a worker process).
+    
+    Parameters
+    ----------
+    path : str
+        Path to the HTML file
+        
+    Returns
+    -------
+    Tuple[Optional[Dict[str, Any]], Optional[str]]
+        (analysis, None) on success, or (None, error message) on failure
+    """
+    try:
+        content = Path(path).read_bytes()
+        return analyze_table_structure(content, path), None
+    except Exception as e:
+        return None, str(e)
+
+
+def _load_analysis_cache() -> Dict[Tuple[str, int, int], Dict[str, Any]]:
+    """
+    Load per-file analyses saved by a previous run.
+    
+    Returns
+    -------
+    Dict[Tuple[str, int, int], Dict[str, Any]]
+        Analyses keyed by (path, mtime_ns, size); empty if there is no
+        usable cache
+    """
+    try:
+        with open(ANALYSIS_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cached, dict) or cached.get('version') != ANALYSIS_CACHE_VERSION:
+        return {}
+    analyses: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+    try:
+        for path, entry in cached['analyses'].items():
+            analysis = entry['analysis']
+            # JSON object keys are strings; row_variations is keyed by cell count
+            analysis['row_variations'] = {
+                int(cell_count): count for cell_count, count in analysis['row_variations'].items()
+            }
+            analyses[(path, entry['mtime_ns'], entry['size'])] = analysis
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return {}
+    return analyses
+
+
+def _save_analysis_cache(analyses: Dict[Tuple[str, int, int], Dict[str, Any]]) -> None:
+    """
+    Save per-file analyses for the next run.
+    
+    Parameters
+    ----------
+    analyses : Dict[Tuple[str, int, int], Dict[str, Any]]
+        Analyses keyed by (path, mtime_ns, size)
+    """
+    entries = {
+        path: {'mtime_ns': mtime_ns, 'size': size, 'analysis': analysis}
+        for (path, mtime_ns, size), analysis in analyses.items()
+    }
+    with open(ANALYSIS_CACHE_FILE, 'w', encoding='utf-8') as f:
+        json.dump({'version': ANALYSIS_CACHE_VERSION, 'analyses': entries}, f)
+
+
 def verify_all_tables() -> Dict[str, Any]:
     """
     Verify parsing for all cached HTML files.
@@ -110,27 +187,55 @@ def verify_all_tables() -> Dict[str, Any]:
     missing_tables = []
     parsing_errors = []
     
+    # Reuse analyses of files unchanged since the last run
+    cache = _load_analysis_cache()
+    keys: Dict[str, Tuple[str, int, int]] = {}
     for html_file in html_files:
+        path = str(html_file)
         try:
-            content = html_file.read_text(encoding='utf-8')
-            analysis = analyze_table_structure(content, str(html_file))
-            results.append(analysis)
-            
-            # Collect statistics
-            if not analysis['table_found']:
-                missing_tables.append(str(html_file))
-            
-            for issue in analysis['parsing_issues']:
-                issues_summary[issue] += 1
-            
-            for cell_count, count in analysis['row_variations'].items():
-                row_variations[cell_count] += count
-        
-        except Exception as e:
+            stat = html_file.stat()
+        except OSError as e:
             parsing_errors.append({
-                'file': str(html_file),
+                'file': path,
                 'error': str(e)
             })
+            continue
+        keys[path] = (path, stat.st_mtime_ns, stat.st_size)
+    paths = list(keys)
+    misses = [path for path in paths if keys[path] not in cache]
+    print(f"  {len(paths) - len(misses)} unchanged (cached), {len(misses)} to parse")
+    
+    # Parsing is CPU-bound and independent per file: spread it over processes
+    outcomes: Dict[str, Tuple[Optional[Dict[str, Any]], Optional[str]]] = {}
+    if misses:
+        chunksize = max(1, len(misses) // ((os.cpu_count() or 1) * 4))
+        with ProcessPoolExecutor() as executor:
+            outcomes = dict(zip(misses, executor.map(_analyze_file, misses, chunksize=chunksize)))
+    
+    # Collect the statistics in file order; errors are not cached, so they are retried
+    new_cache: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+    for path in paths:
+        key = keys[path]
+        analysis, error = (cache[key], None) if key in cache else outcomes[path]
+        if analysis is None:
+            parsing_errors.append({
+                'file': path,
+                'error': error
+            })
+            continue
+        new_cache[key] = analysis
+        results.append(analysis)
+        
+        # Collect statistics
+        if not analysis['table_found']:
+            missing_tables.append(path)
+        
+        for issue in analysis['parsing_issues']:
+            issues_summary[issue] += 1
+        
+        for cell_count, count in analysis['row_variations'].items():
+            row_variations[cell_count] += count
+    _save_analysis_cache(new_cache)
     
     # Summary
     summary = {
@@ -211,8 +316,12 @@ def main() -> None:
     
     # Save detailed results
     output_file = Path("table_verification.json")
-    with open(output_file, 'w') as f:
-        json.dump(summary, f, indent=2)
+    if HAS_ORJSON:
+        # Row variation counts are keyed by int cell counts
+        output_file.write_bytes(orjson.dumps(summary, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(output_file, 'w') as f:
+            json.dump(summary, f, indent=2)
     
     print(f"\n✅ Detailed verification saved to: {output_file}")
 